@@ -6,6 +6,7 @@
 """
 
 import pygame
+import random
 from typing import Tuple, Optional, List
 
 
@@ -243,7 +244,6 @@ class MovementController:
             # 如果还是碰撞，随机方向
             new_rect = pygame.Rect(new_x, new_y, obj_width, obj_height)
             if new_rect.colliderect(avoid_rect):
-                import random
                 new_dx = random.uniform(-2, 2)
                 new_dy = random.uniform(-2, 2)
                 new_x = x + new_dx
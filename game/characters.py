@@ -9,6 +9,14 @@ import pygame
 import math
 import random
 
+# 转圈动画的位移查找表：角度→(dx, dy)，半径5像素，
+# 渲染时查表代替每帧的三角函数计算
+_SPIN_RADIUS = 5
+_SPIN_OFFSETS = [
+    (_SPIN_RADIUS * math.cos(math.radians(a)), _SPIN_RADIUS * math.sin(math.radians(a)))
+    for a in range(360)
+]
+
 class Character:
     """角色基类"""
     
@@ -48,7 +56,19 @@ class Character:
         
         # 状态
         self.active = True
-    
+
+        # 名字文本固定，字体与渲染结果只做一次（首次render时惰性生成）
+        self._name_font = None
+        self._name_surf = None
+
+    def _get_name_surface(self):
+        """取预渲染的名字Surface（首次调用时生成并缓存）。"""
+        if self._name_surf is None:
+            if self._name_font is None:
+                self._name_font = pygame.font.Font(None, 24)
+            self._name_surf = self._name_font.render(self.name, True, (0, 0, 0))
+        return self._name_surf
+
     def update(self):
         """更新角色状态"""
         if not self.active:
@@ -179,12 +199,11 @@ class Character:
                        (self.x + self.width // 4, mouth_y - 5, 
                         self.width // 2, 10), 0, math.pi, 2)
         
-        # 绘制名字
-        font = pygame.font.Font(None, 24)
-        text = font.render(self.name, True, (0, 0, 0))
+        # 绘制名字（缓存的预渲染文本）
+        text = self._get_name_surface()
         text_rect = text.get_rect(center=(self.x + self.width // 2, render_y - 20))
         screen.blit(text, text_rect)
-    
+
     def get_rect(self):
         """获取角色矩形区域"""
         return pygame.Rect(self.x, self.y, self.width, self.height)
@@ -243,9 +262,8 @@ class DonaldDuck(Character):
                           (self.x + self.width // 4, mouth_y - 8, 
                            self.width // 2, 16), 2)
         
-        # 绘制名字
-        font = pygame.font.Font(None, 24)
-        text = font.render(self.name, True, (0, 0, 0))
+        # 绘制名字（缓存的预渲染文本）
+        text = self._get_name_surface()
         text_rect = text.get_rect(center=(self.x + self.width // 2, render_y - 25))
         screen.blit(text, text_rect)
 
@@ -281,6 +299,10 @@ class Duckling(Character):
         ]
         self._init_appearance()
         self.font = self._load_font(20)
+        # 精灵缓存：外观不变时复用预渲染Surface，避免每帧重复绘制图元
+        self._sprite = None
+        self._sprite_key = None
+        self._sprite_offset = (0, 0)
     
     def _load_font(self, size: int):
         candidates = ["msyh.ttc", "simhei.ttf", "MicrosoftYaHei", "SimHei", None]
@@ -306,67 +328,94 @@ class Duckling(Character):
         self.original_eye_size = 6
         self.restore_original_appearance()
     
-    def render(self, screen):
-        """渲染汤小鸭"""
-        if not self.active:
-            return
-        
-        # 计算实际渲染位置（考虑弹跳和飞行效果）
-        render_y = self.y - self.original_bounce - self.fly_offset
-        
-        # 如果正在转圈，计算旋转后的位置（简化处理：使用偏移）
-        render_x = self.x
-        if self.spinning:
-            # 转圈效果：在原始位置周围做圆周运动
-            radius = 5
-            render_x = self.x + radius * math.cos(math.radians(self.spin_angle))
-            render_y = render_y + radius * math.sin(math.radians(self.spin_angle))
-        
+    def _appearance_key(self):
+        """当前外观的缓存键，外观变化（换装主题）时触发精灵重建。"""
+        return (self.color, self.has_hat, self.hat_color, self.has_bow,
+                self.bow_color, self.eye_size)
+
+    def _compose_sprite(self):
+        """将小鸭的所有图元（含名字）预渲染到一张透明Surface上。"""
+        text = self.font.render(self.name, True, (0, 0, 0))
+
+        # 四周留白：帽子/蝴蝶结超出身体，名字可能比身体更宽
+        pad_side = max(8, (text.get_width() - self.width) // 2 + 2)
+        pad_top = 34
+        pad_bottom = 8
+        sprite = pygame.Surface(
+            (self.width + pad_side * 2, self.height + pad_top + pad_bottom),
+            pygame.SRCALPHA,
+        )
+        sx, sy = pad_side, pad_top
+
         # 绘制身体
-        body_rect = (render_x, render_y, self.width, self.height)
-        pygame.draw.ellipse(screen, self.color, body_rect)
-        pygame.draw.ellipse(screen, (0, 0, 0), body_rect, 2)
-        
+        body_rect = (sx, sy, self.width, self.height)
+        pygame.draw.ellipse(sprite, self.color, body_rect)
+        pygame.draw.ellipse(sprite, (0, 0, 0), body_rect, 2)
+
         # 帽子
         if self.has_hat:
-            hat_rect = (render_x - 4, render_y - 12, self.width + 8, 15)
-            pygame.draw.ellipse(screen, self.hat_color, hat_rect)
-            pygame.draw.ellipse(screen, (0, 0, 0), hat_rect, 2)
+            hat_rect = (sx - 4, sy - 12, self.width + 8, 15)
+            pygame.draw.ellipse(sprite, self.hat_color, hat_rect)
+            pygame.draw.ellipse(sprite, (0, 0, 0), hat_rect, 2)
             # 绘制帽子上的穗（只有有帽子时才绘制）
-            tassel_y = render_y - 12
-            tassel_x = render_x + self.width // 2
-            pygame.draw.circle(screen, (255, 255, 0), (tassel_x, tassel_y), 3)
-            pygame.draw.circle(screen, (0, 0, 0), (tassel_x, tassel_y), 3, 1)
-        
+            tassel_y = sy - 12
+            tassel_x = sx + self.width // 2
+            pygame.draw.circle(sprite, (255, 255, 0), (tassel_x, tassel_y), 3)
+            pygame.draw.circle(sprite, (0, 0, 0), (tassel_x, tassel_y), 3, 1)
+
         # 绘制眼睛
         eye_size = self.eye_size
-        eye_y = render_y + self.height // 3
-        pygame.draw.circle(screen, (0, 0, 0), 
-                         (render_x + self.width // 3, eye_y), eye_size)
-        pygame.draw.circle(screen, (0, 0, 0), 
-                         (render_x + 2 * self.width // 3, eye_y), eye_size)
-        
+        eye_y = sy + self.height // 3
+        pygame.draw.circle(sprite, (0, 0, 0),
+                         (sx + self.width // 3, eye_y), eye_size)
+        pygame.draw.circle(sprite, (0, 0, 0),
+                         (sx + 2 * self.width // 3, eye_y), eye_size)
+
         # 绘制嘴巴（使用完整的椭圆，参考唐老鸭的绘制方式）
-        mouth_y = render_y + 2 * self.height // 3
-        # 绘制填充的嘴巴（完整的椭圆）
-        beak_rect = (render_x + self.width // 4, mouth_y - 6, self.width // 2, 12)
-        pygame.draw.ellipse(screen, self.beak_color, beak_rect)
-        # 绘制嘴巴边框（完整的椭圆边框）
-        pygame.draw.ellipse(screen, (0, 0, 0), beak_rect, 2)
-        
+        mouth_y = sy + 2 * self.height // 3
+        beak_rect = (sx + self.width // 4, mouth_y - 6, self.width // 2, 12)
+        pygame.draw.ellipse(sprite, self.beak_color, beak_rect)
+        pygame.draw.ellipse(sprite, (0, 0, 0), beak_rect, 2)
+
         # 蝴蝶结
         if self.has_bow:
             bow_width = self.width // 2
-            bow_rect = (render_x + self.width // 4, render_y + self.height - 8, bow_width, 12)
-            pygame.draw.ellipse(screen, self.bow_color, bow_rect)
-            pygame.draw.ellipse(screen, (0, 0, 0), bow_rect, 2)
-        
+            bow_rect = (sx + self.width // 4, sy + self.height - 8, bow_width, 12)
+            pygame.draw.ellipse(sprite, self.bow_color, bow_rect)
+            pygame.draw.ellipse(sprite, (0, 0, 0), bow_rect, 2)
+
         # 绘制名字（根据是否有帽子调整位置）
-        text = self.font.render(self.name, True, (0, 0, 0))
-        # 如果有帽子，名字位置更靠上，避免被帽子挡住
-        name_y = render_y - 20 if self.has_hat else render_y - 15
-        text_rect = text.get_rect(center=(render_x + self.width // 2, name_y))
-        screen.blit(text, text_rect)
+        name_y = sy - 20 if self.has_hat else sy - 15
+        text_rect = text.get_rect(center=(sx + self.width // 2, name_y))
+        sprite.blit(text, text_rect)
+
+        self._sprite_offset = (sx, sy)
+        return sprite.convert_alpha()
+
+    def render(self, screen):
+        """渲染汤小鸭"""
+        if not self.active:
+            return
+
+        # 计算实际渲染位置（考虑弹跳和飞行效果）
+        render_y = self.y - self.original_bounce - self.fly_offset
+
+        # 如果正在转圈，计算旋转后的位置（简化处理：使用偏移）
+        render_x = self.x
+        if self.spinning:
+            # 转圈效果：在原始位置周围做圆周运动（查表取位移）
+            dx, dy = _SPIN_OFFSETS[int(self.spin_angle) % 360]
+            render_x = self.x + dx
+            render_y = render_y + dy
+
+        # 外观未变化时直接blit缓存精灵
+        key = self._appearance_key()
+        if self._sprite is None or key != self._sprite_key:
+            self._sprite = self._compose_sprite()
+            self._sprite_key = key
+
+        ox, oy = self._sprite_offset
+        screen.blit(self._sprite, (render_x - ox, render_y - oy))
     
     def start_random_movement(self):
         """开始随机移动"""
@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 import re
+import traceback
 from typing import Callable, Dict, List, Optional, Tuple
 
 
@@ -73,35 +74,32 @@ class PatternCommandHandler(CommandHandler):
         super().__init__(name, description)
         self.patterns = patterns
         self.handler = handler
-        self._compiled_patterns: List[re.Pattern] = []
-
-        # 编译正则表达式模式
+        # 预编译匹配表：正则模式编译一次，普通字符串预先lower一次
+        self._match_table: List[Tuple[Optional[re.Pattern], Optional[str]]] = []
         for pattern in patterns:
             if pattern.startswith("^") or pattern.startswith(".*"):
                 # 正则表达式模式
                 try:
-                    self._compiled_patterns.append(re.compile(pattern, re.IGNORECASE))
+                    self._match_table.append((re.compile(pattern, re.IGNORECASE), None))
+                    continue
                 except re.error:
                     # 如果编译失败，作为普通字符串处理
-                    self._compiled_patterns.append(None)
-            else:
-                # 普通字符串模式
-                self._compiled_patterns.append(None)
+                    pass
+            # 普通字符串模式
+            self._match_table.append((None, pattern.lower()))
 
     def match(self, user_input: str) -> bool:
         """检查用户输入是否匹配命令模式。"""
         user_input_lower = user_input.lower().strip()
 
-        for i, pattern in enumerate(self.patterns):
-            compiled = self._compiled_patterns[i]
-
+        for compiled, lowered in self._match_table:
             if compiled:
                 # 使用正则表达式匹配
                 if compiled.search(user_input):
                     return True
             else:
                 # 使用字符串包含匹配
-                if pattern.lower() in user_input_lower:
+                if lowered in user_input_lower:
                     return True
 
         return False
@@ -113,7 +111,6 @@ class PatternCommandHandler(CommandHandler):
             return True
         except Exception as e:
             print(f"[CommandProcessor] 执行命令 '{self.name}' 时出错: {e}")
-            import traceback
             traceback.print_exc()
             return False
 
@@ -146,8 +143,8 @@ class CommandProcessor:
         """
         command_handler = PatternCommandHandler(name, patterns, handler, description)
         self._handlers.append((priority, command_handler))
-        # 按优先级排序（优先级高的在前）
-        self._handlers.sort(key=lambda item: item[0])
+        # 注册时就按优先级降序排好，分发时无需再排序
+        self._handlers.sort(key=lambda item: item[0], reverse=True)
         print(f"[CommandProcessor] 注册命令: {name} (模式: {patterns})")
 
     def register_handler(self, handler: CommandHandler, priority: int = 0) -> None:
@@ -159,7 +156,7 @@ class CommandProcessor:
             priority: 优先级
         """
         self._handlers.append((priority, handler))
-        self._handlers.sort(key=lambda item: item[0])
+        self._handlers.sort(key=lambda item: item[0], reverse=True)
         print(f"[CommandProcessor] 注册命令处理器: {handler.name}")
 
     def set_default_handler(self, handler: Callable[[str, Dict], None]) -> None:
@@ -186,8 +183,8 @@ class CommandProcessor:
         if not user_input:
             return False
 
-        # 按注册顺序匹配命令（后注册的优先级更高）
-        for priority, handler in sorted(self._handlers, key=lambda item: item[0], reverse=True):
+        # 处理器列表在注册时已按优先级降序排好
+        for priority, handler in self._handlers:
             if handler.match(user_input):
                 print(f"[CommandProcessor] 匹配命令: {handler.name}")
                 if handler.execute(user_input, context):
@@ -211,8 +208,7 @@ class CommandProcessor:
         Returns:
             命令列表，每个元素为(name, description)元组
         """
-        sorted_handlers = sorted(self._handlers, key=lambda item: item[0], reverse=True)
-        return [(handler.name, handler.description) for _, handler in sorted_handlers]
+        return [(handler.name, handler.description) for _, handler in self._handlers]
 
     def get_help_text(self) -> str:
         """
@@ -222,7 +218,7 @@ class CommandProcessor:
             帮助文本字符串
         """
         lines = ["可用命令："]
-        for _, handler in sorted(self._handlers, key=lambda item: item[0], reverse=True):
+        for _, handler in self._handlers:
             if handler.description:
                 lines.append(f"  - {handler.name}: {handler.description}")
             else:
@@ -7,13 +7,15 @@
 
 import sys
 import os
+import numpy as np
 import pygame
 import threading
 import time
+import traceback
 import warnings
 from typing import Dict, Optional
-from queue import Queue
-import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 warnings.filterwarnings("ignore", category=SyntaxWarning)
 
@@ -48,7 +50,9 @@ class DuckGame:
         # 初始化配置
         self.config = Config()
         
-        # 初始化pygame
+        # 初始化pygame（推荐pygame-ce：blit/事件分发明显更快，API兼容）
+        if not getattr(pygame, "IS_CE", False):
+            print("[提示] 检测到旧版pygame，建议安装pygame-ce以获得更好的性能: pip install pygame-ce")
         pygame.init()
         # 启用窗口调整大小功能，允许最大最小化
         self.screen = pygame.display.set_mode((self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT), pygame.RESIZABLE)
@@ -62,7 +66,14 @@ class DuckGame:
         
         # 角色位置
         self.donald_pos = self.config.DONALD_POSITION
-        self.duckling_positions = self.config.DUCKLING_POSITIONS
+        # 小鸭位置用(N, 2)浮点数组共享存储：移动控制器整块写回，
+        # 避免每帧每只小鸭分配一个坐标元组
+        self.duckling_positions = np.array(self.config.DUCKLING_POSITIONS, dtype=np.float64)
+        # 唐老鸭不会移动，点击命中矩形只需构建一次
+        self.donald_rect = pygame.Rect(
+            self.donald_pos[0], self.donald_pos[1],
+            self.config.CHARACTER_SIZE, self.config.CHARACTER_SIZE
+        )
         
         # 初始化小鸭对象列表（每个小鸭随机外观）
         self.ducklings = []
@@ -76,10 +87,20 @@ class DuckGame:
             self.ducklings.append(duckling)
         
         self.red_packet_game = None
-        self._ui_queue = Queue()  # 线程安全UI消息队列
+        self._ui_queue = deque()  # 单消费者UI消息队列（append/popleft在GIL下原子，无锁）
         
         # 红包游戏状态
         self.red_packet_game_active = False
+        self.game_start_time = 0.0
+        self.game_duration = 30
+
+        # 脏标记：画面内容变化时才重绘并flip，空闲场景跳过整帧渲染。
+        # 任何改变画面的路径（动画、换肤、窗口resize、红包游戏）都要置位
+        # _scene_dirty；窗口曝光类事件（最小化恢复/遮挡重现）也要置位，
+        # 否则SDL要求重画时空闲场景会一直停在旧帧（见_mark_scene_dirty）。
+        # _was_animating保证动画结束后再多绘一帧复位画面。
+        self._scene_dirty = True
+        self._was_animating = False
         
         # 唐小鸭移动状态
         self.duckling_positions_original = self.duckling_positions.copy()
@@ -111,9 +132,12 @@ class DuckGame:
         self._init_red_packet_game_manager()
         
         # 初始化UI基础设施
-        self._tk_root_manager = TkRootManager(update_interval=5)
+        self._tk_root_manager = TkRootManager()
         self._ui_queue_processor = UIQueueProcessor()
         self._need_config_dialog = False  # 标记是否需要创建配置对话框
+        self._ui_pump_started = False  # Tk.after队列泵是否已启动
+        # AI请求复用单工作线程：请求天然串行（共享对话历史），避免每次提问都新建线程
+        self._ai_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ai-chat")
         self.code_stats_ui: Optional[CodeStatisticsUI] = None
         self.chat_ui: Optional[ChatDialogManager] = None
         
@@ -142,6 +166,9 @@ class DuckGame:
                 stop_behavior_callback=self.stop_duck_behavior,
                 default_target_dir=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),  # 项目根目录
             )
+
+            # 用Tk.after自调度驱动UI队列消费，与pygame帧率解耦
+            self._start_ui_queue_pump()
         else:
             print("[WARNING] Tkinter root 初始化失败，UI功能可能不可用")
             # 即使初始化失败，也尝试注册处理器（可能部分功能仍可用）
@@ -181,7 +208,8 @@ class DuckGame:
         # change_duckling_theme 消息处理
         def handle_change_theme(item):
             theme = item[1] if len(item) > 1 else "original"
-            if hasattr(self, 'ducklings') and self.ducklings:
+            self._scene_dirty = True
+            if self.ducklings:
                 for duckling in self.ducklings:
                     if theme == "excited":
                         duckling.switch_to_excited_theme()
@@ -197,8 +225,7 @@ class DuckGame:
         # duck_behavior 消息处理
         def handle_duck_behavior(item):
             event_name = item[1] if len(item) > 1 else ""
-            if hasattr(self, 'behavior_manager'):
-                self.behavior_manager.trigger(event_name, getattr(self, 'ducklings', []))
+            self.behavior_manager.trigger(event_name, self.ducklings)
         
         def handle_show_roll_call_window(item):
             if not hasattr(self, 'roll_call_manager') or not hasattr(self, '_tk_root_manager'):
@@ -209,7 +236,6 @@ class DuckGame:
                     self.roll_call_manager.show_window(tk_root)
                 except Exception as e:
                     print(f"[DuckGame] 显示点名窗口失败: {e}")
-                    import traceback
                     traceback.print_exc()
         
         def handle_show_roll_call_records_window(item):
@@ -270,10 +296,8 @@ class DuckGame:
     
     def handle_click(self, pos):
         """处理鼠标点击事件"""
-        # 检查是否点击了唐老鸭
-        donald_rect = pygame.Rect(self.donald_pos[0], self.donald_pos[1], 
-                                 self.config.CHARACTER_SIZE, self.config.CHARACTER_SIZE)
-        if donald_rect.collidepoint(pos):
+        # 检查是否点击了唐老鸭（使用缓存的命中矩形）
+        if self.donald_rect.collidepoint(pos):
             self.show_dialog()
     
     def show_dialog(self):
@@ -304,7 +328,7 @@ class DuckGame:
         def handle_ai_chat(user_input: str, ctx: Dict):
             game = ctx["game"]
             game._update_text_display("唐老鸭: 好的！让我来回答你的问题！\n\n")
-            threading.Thread(target=game.start_ai_chat, args=(user_input,), daemon=True).start()
+            game._ai_executor.submit(game.start_ai_chat, user_input)
         
         self.command_processor.register(
             name="ai_chat",
@@ -328,11 +352,14 @@ class DuckGame:
         # 注册"统计代码: <路径>"命令
         def handle_code_stat_quick(user_input: str, ctx: Dict):
             game = ctx["game"]
-            m = re.match(r'^\s*统计代码[：:]\s*(.+)\s*$', user_input)
-            if not m:
+            # 直接按冒号切分取路径，避免每次命令都跑一遍正则
+            stripped = user_input.strip()
+            sep = '：' if '：' in stripped else ':'
+            _, found, path_part = stripped.partition(sep)
+            path_part = path_part.strip()
+            if not found or not path_part:
                 game._update_text_display("唐老鸭: 请提供要统计的目录路径，格式：统计代码: <目录路径>\n\n")
                 return
-            path_part = m.group(1)
             if (path_part.startswith('"') and path_part.endswith('"')) or (path_part.startswith("'") and path_part.endswith("'")):
                 path_part = path_part[1:-1]
             path_part = path_part.strip()
@@ -355,7 +382,6 @@ class DuckGame:
                 try:
                     game.roll_call_manager.request_window()
                 except Exception as e:
-                    import traceback
                     traceback.print_exc()
                     game._update_text_display(f"唐老鸭: 打开点名窗口失败: {e}\n")
             else:
@@ -385,7 +411,7 @@ class DuckGame:
         # 设置默认处理器（普通AI对话）
         def handle_default_ai(user_input: str, ctx: Dict):
             game = ctx["game"]
-            threading.Thread(target=game.get_ai_response, args=(user_input,), daemon=True).start()
+            game._ai_executor.submit(game.get_ai_response, user_input)
         
         self.command_processor.set_default_handler(handle_default_ai)
     
@@ -411,24 +437,24 @@ class DuckGame:
             
         except Exception as e:
             print(f"红包游戏错误: {e}")
-            import traceback
             traceback.print_exc()
             self._update_text_display(f"唐老鸭: 抱歉，红包游戏出现了问题: {str(e)}\n\n")
     
     def start_red_packet_game_logic(self):
         """启动红包游戏逻辑"""
-        # 初始化游戏状态
+        # 初始化游戏状态（先记录起始时间，再置激活标志，
+        # 避免主循环在两者之间读到过期的起始时间）
+        self.game_start_time = time.time()
+        self.game_duration = 30
         self.red_packet_game_active = True
         if not self.red_packet_game:
             self._init_red_packet_game_manager()
         if self.red_packet_game:
             self.red_packet_game.start(duration=30)
         self.state_manager.set_state(GameState.RED_PACKET_GAME)
-        self.game_start_time = time.time()
-        self.game_duration = 30
         
         # 切换小鸭外观为兴奋主题（红包主题）- 通过UI队列确保在主线程执行
-        self._ui_queue.put(("change_duckling_theme", "excited"))
+        self._ui_queue.append(("change_duckling_theme", "excited"))
         # 触发红包行为
         self.trigger_duck_behavior("red_packet")
     
@@ -443,7 +469,7 @@ class DuckGame:
             self.red_packet_game.stop()
         
         # 恢复小鸭的原始外观 - 通过UI队列确保在主线程执行
-        self._ui_queue.put(("change_duckling_theme", "original"))
+        self._ui_queue.append(("change_duckling_theme", "original"))
         
         # 同步位
         self._sync_ducklings_from_positions()
@@ -455,26 +481,17 @@ class DuckGame:
             # 触发AI行为（转圈+语音）
             self.trigger_duck_behavior("ai_chat")
             # 换装为AI问答主题
-            self._ui_queue.put(("change_duckling_theme", "chat"))
+            self._ui_queue.append(("change_duckling_theme", "chat"))
             # 显示正在思考（使用线程安全的方式）
             self._update_text_display("唐老鸭: 让我想想...\n")
-            
-            # 使用AI服务
-            ai_response = self.ai_service.chat_completions(
-                user_input=user_input,
-                temperature=0.7,
-                max_tokens=500,
-                timeout=30
-            )
-            
-            # 使用线程安全的方式显示结果
-            self._update_text_display(f"唐老鸭: {ai_response}\n\n")
+
+            # 使用AI服务（流式输出，首token即上屏）
+            self._stream_ai_response(user_input)
             # AI问答结束后恢复原状
-            self._ui_queue.put(("change_duckling_theme", "original"))
+            self._ui_queue.append(("change_duckling_theme", "original"))
                 
         except Exception as e:
             print(f"AI对话错误: {e}")
-            import traceback
             traceback.print_exc()
             # 使用线程安全的方式显示错误
             self._update_text_display(f"唐老鸭: 抱歉，AI服务出现了问题: {str(e)}\n\n")
@@ -496,21 +513,21 @@ class DuckGame:
     def _update_text_display(self, text):
         """将文本更新请求放入队列，由主线程消费后更新Tkinter组件。"""
         try:
-            self._ui_queue.put(("append_text", text), block=False)
+            self._ui_queue.append(("append_text", text))
         except Exception as e:
             print(f"提交文本更新到队列失败: {e}")
 
     def _enqueue_show_charts(self, code_result, function_stats=None, c_function_stats=None, detail_table=None):
         """兼容旧逻辑，转由 UI 控制器调度。"""
         try:
-            self._ui_queue.put(("show_charts", code_result, function_stats, c_function_stats, detail_table), block=False)
+            self._ui_queue.append(("show_charts", code_result, function_stats, c_function_stats, detail_table))
         except Exception as e:
             print(f"提交图表显示到队列失败: {e}")
 
     def trigger_duck_behavior(self, event_name: str):
         """将行为触发放入队列，确保在主线程中执行。"""
         try:
-            self._ui_queue.put(("duck_behavior", event_name), block=False)
+            self._ui_queue.append(("duck_behavior", event_name))
         except Exception as e:
             print(f"提交行为触发到队列失败: {e}")
 
@@ -522,55 +539,130 @@ class DuckGame:
     def _process_ui_queue(self, limit_per_frame: int = 20):
         """在主线程中调用：消费UI队列并执行对应Tk操作。"""
         self._ui_queue_processor.process_queue(self._ui_queue, limit_per_frame)
+
+    def _start_ui_queue_pump(self, interval_ms: int = 16):
+        """通过Tk.after自调度消费UI队列，避免在pygame帧里轮询。
+
+        after回调在Tk事件循环被驱动时触发（本项目中即update_loop调用
+        root.update()时），因此队列延迟不再额外受pygame帧率限制。
+        """
+        root = self._tk_root_manager.get_root()
+        if not root:
+            return
+
+        def _pump():
+            try:
+                self._process_ui_queue()
+            except Exception:
+                pass
+            try:
+                root.after(interval_ms, _pump)
+            except Exception:
+                # 根窗口已销毁（TclError），停止自调度
+                pass
+
+        try:
+            root.after(interval_ms, _pump)
+            self._ui_pump_started = True
+        except Exception:
+            pass
     
+    def _stream_ai_response(self, user_input):
+        """流式获取AI响应并逐片段写入UI队列，首个片段带上角色前缀。
+
+        片段进入UI队列后由UIQueueProcessor按帧合并，每帧最多触发一次
+        Tk文本插入：流式的即时反馈与批量的控件更新互不拖累。
+        """
+        got_any = False
+        for delta in self.ai_service.stream_chat_completions(
+            user_input=user_input,
+            temperature=0.7,
+            max_tokens=500,
+            timeout=30
+        ):
+            if not got_any:
+                self._update_text_display(f"唐老鸭: {delta}")
+                got_any = True
+            else:
+                self._update_text_display(delta)
+        if got_any:
+            self._update_text_display("\n\n")
+
     def get_ai_response(self, user_input):
         """获取AI响应（在后台线程中运行）"""
         try:
             # 显示正在思考（使用线程安全的方式）
             self._update_text_display("唐老鸭: 让我想想...\n")
-            
-            # 使用AI服务
-            ai_response = self.ai_service.chat_completions(
-                user_input=user_input,
-                temperature=0.7,
-                max_tokens=500,
-                timeout=30
-            )
-            
-            # 使用线程安全的方式更新UI
-            self._update_text_display(f"唐老鸭: {ai_response}\n\n")
-                
+
+            # 使用AI服务（流式输出，token到达即更新UI）
+            self._stream_ai_response(user_input)
+
         except Exception as e:
             print(f"AI响应错误: {e}")
             # 使用线程安全的方式显示错误
             self._update_text_display(f"唐老鸭: 抱歉，我暂时无法回答这个问题: {str(e)}\n\n")
     
     def render(self):
-        """渲染游戏画面"""
+        """渲染游戏画面（仅在画面内容变化时重绘并flip）"""
+        if not self._scene_dirty:
+            return
+        self._scene_dirty = False
         self.render_manager.render_all(
             donald_pos=self.donald_pos,
             red_packet_game=self.red_packet_game,
-            red_packet_game_active=getattr(self, 'red_packet_game_active', False)
+            red_packet_game_active=self.red_packet_game_active
         )
     
     def _handle_resize(self, width: int, height: int):
         """处理窗口大小改变"""
         self.config.SCREEN_WIDTH = width
         self.config.SCREEN_HEIGHT = height
+        if hasattr(self, 'render_manager'):
+            self.render_manager.handle_resize()
+        self._scene_dirty = True
     
+    def _mark_scene_dirty(self):
+        """强制下一帧重绘。
+
+        由GameLoop在窗口曝光类事件（WINDOWEXPOSED/WINDOWRESTORED/
+        WINDOWSHOWN）时调用：SDL此时期望应用重画，画面即使"没变"
+        也要重新提交一帧，否则最小化恢复后窗口停留在旧帧或黑屏。
+        """
+        self._scene_dirty = True
+
+    def _is_idle(self) -> bool:
+        """主循环是否空闲：无动画、画面干净、无Tk窗口、UI队列为空。
+
+        空闲时GameLoop用event.wait挂起等待，而不是满帧率空转。
+        """
+        if self.red_packet_game_active:
+            return False
+        if self._scene_dirty or self._was_animating:
+            return False
+        if self._ui_queue:
+            return False
+        dialog_active = self.chat_ui.is_active() if self.chat_ui else False
+        config_active = self.code_stats_ui.has_active_window() if self.code_stats_ui else False
+        return not (dialog_active or config_active)
+
     def _update_ui(self):
         """更新UI（在游戏循环中调用）"""
-        # 定期更新Tkinter，确保输入和关闭事件能够被处理
+        # 定期更新Tkinter，确保输入和关闭事件能够被处理。
+        # 两个活跃判断在无窗口时都只是属性读取（不触发Tcl调用），
+        # 无活跃窗口时update_loop内部按壁钟节流，跳过大部分帧
         dialog_active = self.chat_ui.is_active() if self.chat_ui else False
         config_active = self.code_stats_ui.has_active_window() if self.code_stats_ui else False
-        has_active_windows = dialog_active or config_active
-        self._tk_root_manager.update_loop(has_active_windows)
+        # 队列里有待处理消息时也算"有Tk工作"：让after泵的定时事件立即
+        # 得到服务，而不是等空闲节流放行；无窗口且队列为空时退回30Hz节流
+        has_tk_work = dialog_active or config_active or bool(self._ui_queue)
+        self._tk_root_manager.update_loop(has_tk_work)
 
-        # 无论Tk窗口是否存在，都处理一次UI队列
-        try:
-            self._process_ui_queue()
-        except Exception:
-            pass
+        # 队列消费由Tk.after泵负责；仅在Tk不可用时退回逐帧处理
+        if not self._ui_pump_started:
+            try:
+                self._process_ui_queue()
+            except Exception:
+                pass
     
     def run(self):
         """运行游戏主循环"""
@@ -581,7 +673,9 @@ class DuckGame:
             render_callback=self.render,
             handle_click_callback=self.handle_click,
             handle_resize_callback=self._handle_resize,
+            handle_expose_callback=self._mark_scene_dirty,
             ui_update_callback=self._update_ui,
+            is_idle_callback=self._is_idle,
             fps=60
         )
         
@@ -601,38 +695,54 @@ class DuckGame:
         if hasattr(self, '_tk_root_manager'):
             self._tk_root_manager.shutdown()
         
+        # 关闭AI请求工作线程（不等待未完成的请求）
+        self._ai_executor.shutdown(wait=False)
+
         pygame.quit()
     
     def update(self):
         """更新游戏状态"""
+        # 每帧热路径：相关属性都在__init__中确定存在，
+        # 绑定到局部变量后直接访问，省去逐帧的hasattr/getattr探测
+        ducklings = self.ducklings
+        game_active = self.red_packet_game_active
+
         # 更新小鸭行为状态和动画
-        if hasattr(self, 'ducklings'):
-            allow_override = not getattr(self, 'red_packet_game_active', False)
-            for duckling in self.ducklings:
-                # 更新动画状态（弹跳、转圈、飞行等）
-                duckling.update()
-                # 更新行为状态（如果有）
-                if hasattr(duckling, 'update_behavior_state'):
-                    duckling.update_behavior_state(allow_position_override=allow_override)
-        if hasattr(self, 'behavior_manager'):
-            self.behavior_manager.update()
-        
+        allow_override = not game_active
+        # 小鸭同构，行为状态能力只需在循环外判断一次
+        has_behavior_state = bool(ducklings) and hasattr(ducklings[0], 'update_behavior_state')
+        for duckling in ducklings:
+            # 更新动画状态（弹跳、转圈、飞行等）
+            duckling.update()
+            # 更新行为状态（如果有）
+            if has_behavior_state:
+                duckling.update_behavior_state(allow_position_override=allow_override)
+        self.behavior_manager.update()
+
+        # 脏标记：有动画或红包游戏进行中时每帧重绘；动画刚结束时再绘一帧复位画面
+        animating = game_active or any(
+            d.animating or d.spinning or d.flying or d.moving
+            for d in ducklings
+        )
+        if animating or self._was_animating:
+            self._scene_dirty = True
+        self._was_animating = animating
+
         # 更新红包游戏状态（如果有）
-        if hasattr(self, 'red_packet_game_active') and self.red_packet_game_active:
+        if game_active:
             self.update_red_packet_game(1 / 60)
-            
+
             # 检查游戏是否结束（30秒后）
-            if hasattr(self, 'game_start_time'):
-                elapsed = time.time() - self.game_start_time
-                if elapsed >= self.game_duration:
-                    self.end_red_packet_game()
+            elapsed = time.time() - self.game_start_time
+            if elapsed >= self.game_duration:
+                self.end_red_packet_game()
         
         # 更新对话框UI状态
         if self.chat_ui:
             self.chat_ui.update()
         
-        # 检查并创建配置对话框（如果需要）
-        if hasattr(self, '_need_config_dialog') and self._need_config_dialog:
+        # 检查并创建配置对话框（仅由标志触发，无需每帧探测）
+        if self._need_config_dialog:
             self._need_config_dialog = False
             try:
                 if self.code_stats_ui:
@@ -641,7 +751,6 @@ class DuckGame:
                     self._message_dialog.show_error("Tk 窗口尚未初始化，无法打开配置界面。", "错误")
             except Exception as e:
                 print(f"创建配置对话框时出错: {e}")
-                import traceback
                 traceback.print_exc()
 
 
@@ -8,6 +8,15 @@
 import pygame
 from typing import Callable, Optional
 
+# 需要强制重绘的窗口曝光类事件：最小化恢复、遮挡后重现、重新显示。
+# SDL投递这些事件时期望应用重画，否则脏标记跳帧会让画面停在旧内容
+_EXPOSE_EVENT_TYPES = (
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWSHOWN,
+    pygame.VIDEOEXPOSE,
+)
+
 
 class GameLoop:
     """游戏循环管理器"""
@@ -19,38 +28,70 @@ class GameLoop:
         render_callback: Callable[[], None],
         handle_click_callback: Optional[Callable[[tuple], None]] = None,
         handle_resize_callback: Optional[Callable[[int, int], None]] = None,
+        handle_expose_callback: Optional[Callable[[], None]] = None,
         ui_update_callback: Optional[Callable[[], None]] = None,
-        fps: int = 60
+        is_idle_callback: Optional[Callable[[], bool]] = None,
+        fps: int = 60,
+        idle_wait_ms: int = 50
     ):
         """
         初始化游戏循环
-        
+
         Args:
             screen: Pygame屏幕表面
             update_callback: 更新回调函数
             render_callback: 渲染回调函数
             handle_click_callback: 点击事件处理回调（可选）
             handle_resize_callback: 窗口大小改变回调（可选）
+            handle_expose_callback: 窗口曝光/恢复显示回调（可选）
             ui_update_callback: UI更新回调（可选）
+            is_idle_callback: 判断当前是否空闲（无动画/无UI活动）的回调（可选）
             fps: 目标帧率
+            idle_wait_ms: 空闲时等待事件的超时（毫秒）
         """
         self.screen = screen
         self.update_callback = update_callback
         self.render_callback = render_callback
         self.handle_click_callback = handle_click_callback
         self.handle_resize_callback = handle_resize_callback
+        self.handle_expose_callback = handle_expose_callback
         self.ui_update_callback = ui_update_callback
+        self.is_idle_callback = is_idle_callback
         self.fps = fps
+        self.idle_wait_ms = idle_wait_ms
         self.running = False
-    
+
     def run(self):
         """运行游戏主循环"""
         clock = pygame.time.Clock()
         self.running = True
-        
+
+        # 热路径方法绑定为局部变量：主循环每帧都要调用，
+        # 省去逐帧的模块/实例属性查找
+        event_get = pygame.event.get
+        event_wait = pygame.event.wait
+        tick = clock.tick
+        update = self.update_callback
+        render = self.render_callback
+        ui_update = self.ui_update_callback
+        is_idle = self.is_idle_callback
+        fps = self.fps
+        idle_wait_ms = self.idle_wait_ms
+
         while self.running:
+            # 空闲时让操作系统挂起进程等事件，而不是以满帧率空转
+            idle = bool(is_idle and is_idle())
+            if idle:
+                events = []
+                event = event_wait(idle_wait_ms)
+                if event.type != pygame.NOEVENT:
+                    events.append(event)
+                events.extend(event_get())
+            else:
+                events = event_get()
+
             # 处理事件
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
                 elif event.type == pygame.VIDEORESIZE:
@@ -60,19 +101,24 @@ class GameLoop:
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1 and self.handle_click_callback:  # 左键点击
                         self.handle_click_callback(event.pos)
-            
+                elif event.type in _EXPOSE_EVENT_TYPES:
+                    # 窗口曝光/恢复：通知上层置脏，保证跳帧渲染下也重画
+                    if self.handle_expose_callback:
+                        self.handle_expose_callback()
+
             # 更新游戏状态
-            self.update_callback()
-            
+            update()
+
             # 渲染画面
-            self.render_callback()
-            
+            render()
+
             # UI更新（如果提供）
-            if self.ui_update_callback:
-                self.ui_update_callback()
-            
-            # 控制帧率
-            clock.tick(self.fps)
+            if ui_update:
+                ui_update()
+
+            # 控制帧率（空闲帧已通过event.wait完成限速）
+            if not idle:
+                tick(fps)
     
     def stop(self):
         """停止游戏循环"""
@@ -7,6 +7,7 @@
 
 import pygame
 import time
+import numpy as np
 from typing import List, Tuple, Optional, Callable
 from .red_packet import RedPacket
 from .spawner import RedPacketSpawner
@@ -17,6 +18,13 @@ from .renderer import RedPacketRenderer
 from ..base_minigame import BaseMinigame
 from core.event_system import EventManager, GameEvent
 
+# 按红包类型索引的尺寸表：宽高由类型唯一决定，
+# 每帧直接用类型索引取列，省去逐对象读width/height属性
+_PACKET_SIZE_ARR = np.array(
+    [RedPacket.PACKET_TYPES[i]['size'] for i in range(len(RedPacket.PACKET_TYPES))],
+    dtype=np.float64,
+)
+
 
 class RedPacketGameManager(BaseMinigame):
     """红包游戏管理器"""
@@ -59,9 +67,14 @@ class RedPacketGameManager(BaseMinigame):
         self.red_packets: List[RedPacket] = []
         self.original_duckling_positions = duckling_positions.copy()
         
+        # 红包对象池：回收失效实例，30秒对局内零新分配
+        self._packet_pool: List[RedPacket] = []
+        self._packet_pool_cap = 32
+
         # 初始化组件
         self.spawner = RedPacketSpawner(event_manager)
         self.spawner.set_spawn_position_strategy(self._get_spawn_position)
+        self.spawner.set_packet_factory(self._acquire_packet)
         
         self.collision_detector = RedPacketCollisionDetector(screen_width, screen_height)
         
@@ -80,6 +93,19 @@ class RedPacketGameManager(BaseMinigame):
             event_manager.subscribe(GameEvent.RED_PACKET_CAUGHT, self._on_packet_caught)
             event_manager.subscribe(GameEvent.RED_PACKET_HIT_WALL, self._on_packet_hit_wall)
     
+    def _acquire_packet(self, x: float, y: float, packet_type: int) -> RedPacket:
+        """从对象池取出（或新建）红包实例。"""
+        if self._packet_pool:
+            packet = self._packet_pool.pop()
+            packet.reset(x, y, packet_type)
+            return packet
+        return RedPacket(x, y, packet_type)
+
+    def _release_packet(self, packet: RedPacket):
+        """回收红包实例到对象池。"""
+        if len(self._packet_pool) < self._packet_pool_cap:
+            self._packet_pool.append(packet)
+
     def _get_spawn_position(self) -> Tuple[float, float]:
         """获取生成位置（从唐老鸭位置）"""
         start_x = self.donald_pos[0] + self.donald_size // 2
@@ -118,7 +144,9 @@ class RedPacketGameManager(BaseMinigame):
         # 重置小鸭位置
         self.duckling_movement.reset_positions(self.original_duckling_positions)
         
-        # 清理红包
+        # 清理红包（回收进对象池，供下一局复用）
+        for packet in self.red_packets:
+            self._release_packet(packet)
         self.red_packets.clear()
         
         # 发布事件
@@ -154,19 +182,48 @@ class RedPacketGameManager(BaseMinigame):
         # 更新小鸭位置
         self.duckling_movement.update(dt, self.donald_pos, self.donald_size)
         
-        # 更新红包位置
-        for packet in self.red_packets[:]:
-            if not packet.is_active():
-                continue
-            
-            self.packet_movement.update(packet, dt)
-            
-            # 检查碰撞
-            # 1. 检查与小鸭碰撞
-            duckling_idx = self.collision_detector.check_duckling_collision(
-                packet, self.duckling_positions, self.duckling_size
+        # 更新红包位置与碰撞：位置/尺寸以NumPy数组一次性计算，
+        # 颜色、金额等元数据仍保留在RedPacket对象上
+        active_packets = [p for p in self.red_packets if p.is_active()]
+        if active_packets:
+            n = len(active_packets)
+            step = dt * 60.0
+            xs = np.fromiter((p.x for p in active_packets), dtype=np.float64, count=n)
+            ys = np.fromiter((p.y for p in active_packets), dtype=np.float64, count=n)
+            xs += np.fromiter((p.dx for p in active_packets), dtype=np.float64, count=n) * step
+            ys += np.fromiter((p.dy for p in active_packets), dtype=np.float64, count=n) * step
+            types = np.fromiter((p.packet_type for p in active_packets), dtype=np.intp, count=n)
+            ws = _PACKET_SIZE_ARR[types, 0]
+            hs = _PACKET_SIZE_ARR[types, 1]
+            for packet, x, y in zip(active_packets, xs, ys):
+                packet.x = float(x)
+                packet.y = float(y)
+
+            # 1. 与小鸭碰撞（广播比较，一次得到所有红包×小鸭的命中矩阵）
+            caught = np.zeros(len(active_packets), dtype=bool)
+            duck_for_packet = np.zeros(len(active_packets), dtype=np.intp)
+            if len(self.duckling_positions):
+                ducks = np.asarray(self.duckling_positions, dtype=np.float64)
+                size = self.duckling_size
+                hit = (
+                    (xs[:, None] < ducks[None, :, 0] + size)
+                    & (xs[:, None] + ws[:, None] > ducks[None, :, 0])
+                    & (ys[:, None] < ducks[None, :, 1] + size)
+                    & (ys[:, None] + hs[:, None] > ducks[None, :, 1])
+                )
+                caught = hit.any(axis=1)
+                duck_for_packet = hit.argmax(axis=1)
+
+            # 2. 墙壁碰撞（未被小鸭抢到的才计入碰壁）
+            wall = (
+                (xs <= 0) | (xs >= self.screen_width - ws)
+                | (ys <= 0) | (ys >= self.screen_height - hs)
             )
-            if duckling_idx is not None:
+
+            removed = set()
+            for i in np.flatnonzero(caught):
+                packet = active_packets[i]
+                duckling_idx = int(duck_for_packet[i])
                 self.collision_detector.handle_collision(packet, 'duckling')
                 self.statistics.record_packet_caught_by_duckling(duckling_idx, packet)
                 if self.event_manager:
@@ -174,16 +231,25 @@ class RedPacketGameManager(BaseMinigame):
                         GameEvent.DUCKLING_CAUGHT_PACKET,
                         {'duckling_idx': duckling_idx, 'packet': packet}
                     )
-                self.red_packets.remove(packet)
-                continue
-            
-            # 2. 检查墙壁碰撞
-            if self.collision_detector.check_wall_collision(packet):
+                removed.add(id(packet))
+
+            for i in np.flatnonzero(wall & ~caught):
+                packet = active_packets[i]
                 self.collision_detector.handle_collision(packet, 'wall')
                 self.statistics.record_packet_hit_wall(packet)
                 if self.event_manager:
                     self.event_manager.emit(GameEvent.RED_PACKET_HIT_WALL, packet)
-                self.red_packets.remove(packet)
+                removed.add(id(packet))
+
+            # 单遍构建存活列表（O(n)），不在迭代中remove（O(n²)且易漏项）
+            if removed:
+                survivors = []
+                for p in self.red_packets:
+                    if id(p) in removed:
+                        self._release_packet(p)
+                    else:
+                        survivors.append(p)
+                self.red_packets = survivors
     
     def render(self, screen: pygame.Surface):
         """
@@ -6,23 +6,22 @@
 """
 
 import pygame
-import random
-import math
+import numpy as np
 from typing import List, Tuple, Optional
 from .red_packet import RedPacket
 from core.physics_system import MovementController as BaseMovementController
 
 
 class DucklingMovementController:
-    """小鸭移动控制器"""
-    
+    """小鸭移动控制器（位置/速度以NumPy SoA数组批量更新）"""
+
     def __init__(
         self, duckling_positions: List[Tuple[float, float]],
         screen_width: int, screen_height: int, duckling_size: int
     ):
         """
         初始化小鸭移动控制器
-        
+
         Args:
             duckling_positions: 小鸭位置列表（会被修改）
             screen_width, screen_height: 屏幕尺寸
@@ -32,37 +31,40 @@ class DucklingMovementController:
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.duckling_size = duckling_size
-        self.movement_data: List[dict] = []
+        # 屏幕尺寸在一局游戏中不变，边界常量只算一次
+        self._max_x = screen_width - duckling_size
+        self._max_y = screen_height - duckling_size
+        self._velocities: Optional[np.ndarray] = None  # (N, 2) 速度数组
+        self._positions: Optional[np.ndarray] = None  # (N, 2) 位置数组（持久缓冲）
         self.moving = False
         self.movement_controller = BaseMovementController()
-    
+
     def start_movement(self):
         """开始移动"""
         self.moving = True
         self._initialize_movement_data()
-    
+
     def stop_movement(self):
         """停止移动"""
         self.moving = False
-    
+
     def _initialize_movement_data(self):
-        """初始化移动数据"""
-        if not self.movement_data:
-            for _ in range(len(self.duckling_positions)):
-                speed = random.uniform(2.5, 4.0)  # 与红包接近的速度
-                angle = random.uniform(0, 2 * math.pi)
-                dx = math.cos(angle) * speed
-                dy = math.sin(angle) * speed
-                self.movement_data.append({
-                    'dx': dx,
-                    'dy': dy,
-                })
-    
-    def update(self, dt: float = 1.0, donald_pos: Optional[Tuple[float, float]] = None, 
+        """初始化移动数据（随机速度向量，一次性批量生成）"""
+        n = len(self.duckling_positions)
+        if self._velocities is None or len(self._velocities) != n:
+            speeds = np.random.uniform(2.5, 4.0, n)  # 与红包接近的速度
+            angles = np.random.uniform(0, 2 * np.pi, n)
+            self._velocities = np.stack(
+                [np.cos(angles) * speeds, np.sin(angles) * speeds], axis=1
+            )
+        if self._positions is None or len(self._positions) != n:
+            self._positions = np.array(self.duckling_positions, dtype=np.float64).reshape(n, 2)
+
+    def update(self, dt: float = 1.0, donald_pos: Optional[Tuple[float, float]] = None,
                donald_size: int = 80):
         """
         更新小鸭位置
-        
+
         Args:
             dt: 时间增量
             donald_pos: 唐老鸭位置（用于避开）
@@ -70,47 +72,54 @@ class DucklingMovementController:
         """
         if not self.moving:
             return
-        
+
         self._initialize_movement_data()
-        
-        for i in range(len(self.duckling_positions)):
-            movement = self.movement_data[i]
-            current_x, current_y = self.duckling_positions[i]
-            
-            step = dt * 60.0  # 将秒为单位的dt换算为帧步长
-            new_x = current_x + movement['dx'] * step
-            new_y = current_y + movement['dy'] * step
-            
-            # 边界反弹
-            new_x, new_y, new_dx, new_dy = self.movement_controller.apply_bounce(
-                new_x, new_y, movement['dx'], movement['dy'],
-                self.screen_width, self.screen_height,
-                self.duckling_size, self.duckling_size
+        if len(self.duckling_positions) == 0:
+            return
+
+        step = dt * 60.0  # 将秒为单位的dt换算为帧步长
+        pos = self._positions  # 持久缓冲，避免每帧从tuple列表重建数组
+        pos += self._velocities * step
+
+        # 边界反弹（向量化：越界处夹取位置并翻转速度方向）
+        max_x = self._max_x
+        max_y = self._max_y
+        low = pos[:, 0] <= 0
+        high = pos[:, 0] >= max_x
+        self._velocities[low, 0] = np.abs(self._velocities[low, 0])
+        self._velocities[high, 0] = -np.abs(self._velocities[high, 0])
+        low = pos[:, 1] <= 0
+        high = pos[:, 1] >= max_y
+        self._velocities[low, 1] = np.abs(self._velocities[low, 1])
+        self._velocities[high, 1] = -np.abs(self._velocities[high, 1])
+        np.clip(pos[:, 0], 0, max_x, out=pos[:, 0])
+        np.clip(pos[:, 1], 0, max_y, out=pos[:, 1])
+
+        # 避开唐老鸭：向量化求命中掩码，命中（稀少）时回退到标量处理
+        if donald_pos:
+            donald_rect = pygame.Rect(donald_pos[0], donald_pos[1], donald_size, donald_size)
+            size = self.duckling_size
+            hit = (
+                (pos[:, 0] < donald_rect.right) & (pos[:, 0] + size > donald_rect.left)
+                & (pos[:, 1] < donald_rect.bottom) & (pos[:, 1] + size > donald_rect.top)
             )
-            
-            movement['dx'] = new_dx
-            movement['dy'] = new_dy
-            
-            # 避开唐老鸭
-            if donald_pos:
-                donald_rect = pygame.Rect(donald_pos[0], donald_pos[1], donald_size, donald_size)
-                duckling_rect = pygame.Rect(new_x, new_y, self.duckling_size, self.duckling_size)
-                
-                if duckling_rect.colliderect(donald_rect):
-                    new_x, new_y, new_dx, new_dy = self.movement_controller.avoid_collision(
-                        new_x, new_y, movement['dx'], movement['dy'],
-                        donald_rect, self.duckling_size, self.duckling_size
-                    )
-                    movement['dx'] = new_dx
-                    movement['dy'] = new_dy
-            
-            # 更新位置
-            self.duckling_positions[i] = (new_x, new_y)
-    
+            for i in np.flatnonzero(hit):
+                new_x, new_y, new_dx, new_dy = self.movement_controller.avoid_collision(
+                    pos[i, 0], pos[i, 1],
+                    self._velocities[i, 0], self._velocities[i, 1],
+                    donald_rect, size, size
+                )
+                pos[i, 0], pos[i, 1] = new_x, new_y
+                self._velocities[i, 0], self._velocities[i, 1] = new_dx, new_dy
+
+        # 整块写回共享位置数组（无逐元素元组分配）
+        self.duckling_positions[:] = pos
+
     def reset_positions(self, original_positions: List[Tuple[float, float]]):
         """重置位置到原始位置"""
         self.duckling_positions[:] = original_positions[:]
-        self.movement_data.clear()
+        self._velocities = None
+        self._positions = None
 
 
 class RedPacketMovementController:
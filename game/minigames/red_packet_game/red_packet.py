@@ -6,36 +6,66 @@
 """
 
 import pygame
-import random
+import numpy as np
 from typing import Tuple
 
+# 红包类型参数表（按类型0/1/2索引：小/中/大红包），
+# 模块级元组常量，spawn热路径上零分配
+_PACKET_SIZES = ((30, 40), (50, 60), (70, 80))
+_PACKET_COLORS = ((255, 0, 0), (255, 100, 100), (200, 0, 0))
+_PACKET_AMOUNT_RANGES = ((1, 10), (10, 50), (50, 100))
+
+# 批量随机数流：一次RNG调用生成256个[0,1)样本，逐个消费，
+# 摊薄每次spawn的随机数生成开销
+_rng = np.random.default_rng()
+_RAND_BATCH = 256
+_rand_buf = _rng.random(_RAND_BATCH)
+_rand_idx = 0
+
+
+def _next_rand() -> float:
+    """取下一个[0,1)均匀随机数（批量预生成）。"""
+    global _rand_buf, _rand_idx
+    if _rand_idx >= _RAND_BATCH:
+        _rand_buf = _rng.random(_RAND_BATCH)
+        _rand_idx = 0
+    value = _rand_buf[_rand_idx]
+    _rand_idx += 1
+    return float(value)
+
+
+def _uniform(low: float, high: float) -> float:
+    """基于批量随机流的uniform替代。"""
+    return low + (high - low) * _next_rand()
+
 
 class RedPacket:
     """红包实体类"""
-    
-    # 红包类型配置
+
+    # 红包类型配置（保留字典形式供外部查询）
     PACKET_TYPES = {
-        0: {  # 小红包
-            'size': (30, 40),
-            'color': (255, 0, 0),
-            'amount_range': (1, 10)
-        },
-        1: {  # 中红包
-            'size': (50, 60),
-            'color': (255, 100, 100),
-            'amount_range': (10, 50)
-        },
-        2: {  # 大红包
-            'size': (70, 80),
-            'color': (200, 0, 0),
-            'amount_range': (50, 100)
+        i: {
+            'size': _PACKET_SIZES[i],
+            'color': _PACKET_COLORS[i],
+            'amount_range': _PACKET_AMOUNT_RANGES[i],
         }
+        for i in range(3)
     }
     
     def __init__(self, x: float, y: float, packet_type: int = 0):
         """
         初始化红包
-        
+
+        Args:
+            x, y: 初始位置
+            packet_type: 红包类型 (0: 小红包, 1: 中红包, 2: 大红包)
+        """
+        self.reset(x, y, packet_type)
+
+    def reset(self, x: float, y: float, packet_type: int = 0):
+        """
+        重置红包状态（供对象池复用实例，避免重复分配）
+
         Args:
             x, y: 初始位置
             packet_type: 红包类型 (0: 小红包, 1: 中红包, 2: 大红包)
@@ -43,20 +73,19 @@ class RedPacket:
         self.x = x
         self.y = y
         self.packet_type = packet_type
-        
-        # 从配置获取属性
-        config = self.PACKET_TYPES[packet_type]
-        self.width, self.height = config['size']
-        self.color = config['color']
-        
+
+        # 从常量表按索引取属性
+        self.width, self.height = _PACKET_SIZES[packet_type]
+        self.color = _PACKET_COLORS[packet_type]
+
         # 随机生成金额
-        min_amount, max_amount = config['amount_range']
-        self.amount = round(random.uniform(min_amount, max_amount), 2)
-        
+        min_amount, max_amount = _PACKET_AMOUNT_RANGES[packet_type]
+        self.amount = round(_uniform(min_amount, max_amount), 2)
+
         # 移动相关
-        self.dx = random.uniform(-3, 3)
-        self.dy = random.uniform(-3, 3)
-        
+        self.dx = _uniform(-3, 3)
+        self.dy = _uniform(-3, 3)
+
         # 状态
         self.active = True
         self.hit_wall = False
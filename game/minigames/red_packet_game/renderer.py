@@ -6,42 +6,58 @@
 """
 
 import pygame
-from typing import List
+from typing import Dict, List
 from .red_packet import RedPacket
 
 
 class RedPacketRenderer:
     """红包渲染器"""
-    
+
     def __init__(self, screen: pygame.Surface):
         """
         初始化渲染器
-        
+
         Args:
             screen: Pygame屏幕表面
         """
         self.screen = screen
         self.font = pygame.font.Font(None, 16)
-    
+        # 金额文字Surface缓存：同一金额只光栅化一次
+        self._amount_surf_cache: Dict[float, pygame.Surface] = {}
+        # 红包包体Surface缓存：尺寸/颜色由类型决定，每种类型只画一次矩形+边框
+        self._body_surf_cache: Dict[int, pygame.Surface] = {}
+
+    def _get_amount_surface(self, amount: float) -> pygame.Surface:
+        """获取（或渲染并缓存）金额文字Surface。"""
+        surf = self._amount_surf_cache.get(amount)
+        if surf is None:
+            surf = self.font.render(f"¥{amount}", True, (255, 255, 255))
+            self._amount_surf_cache[amount] = surf
+        return surf
+
+    def _get_body_surface(self, packet: RedPacket) -> pygame.Surface:
+        """获取（或绘制并缓存）红包包体Surface。"""
+        surf = self._body_surf_cache.get(packet.packet_type)
+        if surf is None:
+            surf = pygame.Surface((packet.width, packet.height)).convert()
+            surf.fill(packet.color)
+            pygame.draw.rect(surf, (0, 0, 0), surf.get_rect(), 2)
+            self._body_surf_cache[packet.packet_type] = surf
+        return surf
+
     def render_packet(self, packet: RedPacket):
         """
         渲染单个红包
-        
+
         Args:
             packet: 红包对象
         """
         if not packet.is_active():
             return
-        
-        x, y = packet.get_position()
-        width, height = packet.width, packet.height
-        color = packet.color
-        
-        # 绘制红包矩形
-        packet_rect = pygame.Rect(x, y, width, height)
-        pygame.draw.rect(self.screen, color, packet_rect)
-        pygame.draw.rect(self.screen, (0, 0, 0), packet_rect, 2)
-        
+
+        # 绘制红包包体（缓存Surface，一次blit代替两次矩形绘制）
+        self.screen.blit(self._get_body_surface(packet), (packet.x, packet.y))
+
         # 绘制金额
         self.render_amount(packet)
     
@@ -54,21 +70,37 @@ class RedPacketRenderer:
         """
         x, y = packet.get_position()
         width, height = packet.width, packet.height
-        amount = packet.get_amount()
-        
-        amount_text = self.font.render(f"¥{amount}", True, (255, 255, 255))
+
+        amount_text = self._get_amount_surface(packet.get_amount())
         text_rect = amount_text.get_rect(
             center=(x + width // 2, y + height // 2)
         )
         self.screen.blit(amount_text, text_rect)
-    
+
     def render_all(self, packets: List[RedPacket]):
         """
         渲染所有红包
-        
+
         Args:
             packets: 红包列表
         """
+        # 包体与金额文字都用缓存Surface，收集后一次性批量blit
+        # （列表顺序保证文字压在对应包体之上）
+        blit_list = []
         for packet in packets:
-            self.render_packet(packet)
+            if not packet.is_active():
+                continue
+
+            x, y = packet.x, packet.y
+            width, height = packet.width, packet.height
+            blit_list.append((self._get_body_surface(packet), (x, y)))
+
+            surf = self._get_amount_surface(packet.get_amount())
+            blit_list.append(
+                (surf, (x + (width - surf.get_width()) // 2,
+                        y + (height - surf.get_height()) // 2))
+            )
+
+        if blit_list:
+            self.screen.blits(blit_list)
 
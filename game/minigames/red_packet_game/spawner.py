@@ -10,6 +10,8 @@ from typing import Callable, Optional
 from .red_packet import RedPacket
 from core.event_system import EventManager, GameEvent
 
+_randint = random.randint
+
 
 class RedPacketSpawner:
     """红包生成器"""
@@ -26,6 +28,7 @@ class RedPacketSpawner:
         self.spawn_timer = 0
         self.paused = False
         self.spawn_position_strategy: Optional[Callable[[], tuple]] = None
+        self.packet_factory: Optional[Callable[[float, float, int], RedPacket]] = None
     
     def set_spawn_rate(self, rate: int):
         """
@@ -44,7 +47,16 @@ class RedPacketSpawner:
             strategy: 返回 (x, y) 的函数
         """
         self.spawn_position_strategy = strategy
-    
+
+    def set_packet_factory(self, factory: Callable[[float, float, int], RedPacket]):
+        """
+        设置红包构造工厂（如对象池的acquire方法）
+
+        Args:
+            factory: 接收 (x, y, packet_type) 并返回RedPacket的函数
+        """
+        self.packet_factory = factory
+
     def spawn(self, default_x: float = 0, default_y: float = 0) -> RedPacket:
         """
         生成红包
@@ -62,8 +74,11 @@ class RedPacketSpawner:
             x, y = default_x, default_y
         
         # 随机选择红包类型
-        packet_type = random.randint(0, 2)
-        packet = RedPacket(x, y, packet_type)
+        packet_type = _randint(0, 2)
+        if self.packet_factory:
+            packet = self.packet_factory(x, y, packet_type)
+        else:
+            packet = RedPacket(x, y, packet_type)
         
         # 发布事件
         if self.event_manager:
@@ -85,26 +85,28 @@ class RedPacketStatistics:
         }
     
     def format_report(self) -> str:
-        """格式化报告"""
-        report = "红包游戏统计:\n"
-        report += "=" * 50 + "\n"
-        
+        """格式化报告（按行收集后一次join，整串交给单次文本插入）"""
+        parts = [
+            "红包游戏统计:\n",
+            "=" * 50 + "\n",
+        ]
+
         # 小鸭统计
         if self.duckling_stats:
-            report += "小鸭抢到的红包:\n"
+            parts.append("小鸭抢到的红包:\n")
             for duckling_idx in sorted(self.duckling_stats.keys()):
                 stats = self.duckling_stats[duckling_idx]
                 duckling_name = f"唐小鸭{duckling_idx + 1}"
-                report += f"  {duckling_name}: {stats['count']}个, 总金额 ¥{stats['amount']:.2f}\n"
-            report += "\n"
-        
+                parts.append(f"  {duckling_name}: {stats['count']}个, 总金额 ¥{stats['amount']:.2f}\n")
+            parts.append("\n")
+
         # 用户统计
-        report += "您抢到的红包:\n"
-        report += f"  总红包数: {self.user_stats['total_count']}\n"
-        report += f"  总金额: ¥{self.user_stats['total_amount']:.2f}\n"
-        report += f"  小红包: {self.user_stats['type_counts'][0]}个, ¥{self.user_stats['type_amounts'][0]:.2f}\n"
-        report += f"  中红包: {self.user_stats['type_counts'][1]}个, ¥{self.user_stats['type_amounts'][1]:.2f}\n"
-        report += f"  大红包: {self.user_stats['type_counts'][2]}个, ¥{self.user_stats['type_amounts'][2]:.2f}\n"
-        
-        return report
+        parts.append("您抢到的红包:\n")
+        parts.append(f"  总红包数: {self.user_stats['total_count']}\n")
+        parts.append(f"  总金额: ¥{self.user_stats['total_amount']:.2f}\n")
+        parts.append(f"  小红包: {self.user_stats['type_counts'][0]}个, ¥{self.user_stats['type_amounts'][0]:.2f}\n")
+        parts.append(f"  中红包: {self.user_stats['type_counts'][1]}个, ¥{self.user_stats['type_amounts'][1]:.2f}\n")
+        parts.append(f"  大红包: {self.user_stats['type_counts'][2]}个, ¥{self.user_stats['type_amounts'][2]:.2f}\n")
+
+        return "".join(parts)
 
@@ -34,6 +34,20 @@ class RenderManager:
         except:
             self.font = None
             self.small_font = None
+
+        # UI文本内容固定，预渲染一次供每帧blit（字形光栅化只做一次）
+        self._title_surf = None
+        self._hint_surf = None
+        if self.font and self.small_font:
+            self._title_surf = self.font.render("Duck Game", True, (0, 0, 0)).convert_alpha()
+            self._hint_surf = self.small_font.render("Click Donald Duck to start!", True, (0, 0, 0)).convert_alpha()
+
+        # 预渲染唐老鸭精灵：外观固定，每帧只需一次blit而不是9次图元绘制
+        self._donald_sprite = self._build_donald_sprite()
+
+        # 预合成静态背景（天空+云朵+地面），窗口尺寸变化时重建
+        self._bg_surface: pygame.Surface = None
+        self._rebuild_bg()
     
     def render_all(
         self,
@@ -49,12 +63,9 @@ class RenderManager:
             red_packet_game: 红包游戏管理器（可选）
             red_packet_game_active: 红包游戏是否激活
         """
-        # 清屏
-        self.screen.fill(self.config.background_color)
-        
-        # 绘制背景装饰
-        self.render_background()
-        
+        # 绘制静态背景（一次blit完成清屏+装饰）
+        self.screen.blit(self._bg_surface, (0, 0))
+
         # 绘制角色
         self.render_characters(donald_pos)
         
@@ -68,69 +79,68 @@ class RenderManager:
         # 更新显示
         pygame.display.flip()
     
-    def render_background(self):
-        """绘制背景装饰"""
+    def _rebuild_bg(self):
+        """重建静态背景Surface（初始化和窗口大小改变时调用）。
+
+        云朵/地面这些像素不随帧变化，图元绘制只在这里发生一次；
+        每帧渲染只做一次整屏blit（见render_all）。
+        """
+        width = self.config.SCREEN_WIDTH
+        height = self.config.SCREEN_HEIGHT
+        bg = pygame.Surface((width, height))
+        bg.fill(self.config.background_color)
+
         # 绘制云朵
         cloud_color = (255, 255, 255)
         for i in range(3):
             x = 100 + i * 300
             y = 50 + i * 20
-            pygame.draw.ellipse(self.screen, cloud_color, (x, y, 80, 40))
-            pygame.draw.ellipse(self.screen, cloud_color, (x + 20, y - 10, 60, 30))
-            pygame.draw.ellipse(self.screen, cloud_color, (x + 40, y, 60, 30))
-        
+            pygame.draw.ellipse(bg, cloud_color, (x, y, 80, 40))
+            pygame.draw.ellipse(bg, cloud_color, (x + 20, y - 10, 60, 30))
+            pygame.draw.ellipse(bg, cloud_color, (x + 40, y, 60, 30))
+
         # 绘制地面
         ground_color = (34, 139, 34)
-        pygame.draw.rect(
-            self.screen,
-            ground_color,
-            (0, self.config.SCREEN_HEIGHT - 50, self.config.SCREEN_WIDTH, 50)
-        )
+        pygame.draw.rect(bg, ground_color, (0, height - 50, width, 50))
+
+        self._bg_surface = bg.convert()
+
+    def handle_resize(self):
+        """窗口大小改变后重建背景缓存。"""
+        self._rebuild_bg()
     
+    def _build_donald_sprite(self) -> pygame.Surface:
+        """将唐老鸭的所有图元绘制到一张透明Surface上，供每帧blit。"""
+        size = self.config.CHARACTER_SIZE
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+
+        # 身体
+        donald_rect = pygame.Rect(0, 0, size, size)
+        pygame.draw.ellipse(sprite, self.config.DONALD_COLOR, donald_rect)
+        pygame.draw.ellipse(sprite, (0, 0, 0), donald_rect, 3)
+
+        # 眼睛
+        eye_size = 10
+        eye_y = size // 3
+        pygame.draw.circle(sprite, (0, 0, 0), (size // 3, eye_y), eye_size)
+        pygame.draw.circle(sprite, (0, 0, 0), (2 * size // 3, eye_y), eye_size)
+
+        # 嘴巴
+        mouth_y = 2 * size // 3
+        pygame.draw.ellipse(sprite, (255, 165, 0), (size // 4, mouth_y - 8, size // 2, 16))
+
+        return sprite.convert_alpha()
+
     def render_characters(self, donald_pos: tuple):
         """绘制角色"""
-        # 绘制唐老鸭
-        donald_rect = pygame.Rect(
-            donald_pos[0],
-            donald_pos[1],
-            self.config.CHARACTER_SIZE,
-            self.config.CHARACTER_SIZE
-        )
-        pygame.draw.ellipse(self.screen, self.config.DONALD_COLOR, donald_rect)
-        pygame.draw.ellipse(self.screen, (0, 0, 0), donald_rect, 3)
-        
-        # 绘制唐老鸭的眼睛
-        eye_size = 10
-        eye_y = donald_pos[1] + self.config.CHARACTER_SIZE // 3
-        pygame.draw.circle(
-            self.screen,
-            (0, 0, 0),
-            (donald_pos[0] + self.config.CHARACTER_SIZE // 3, eye_y),
-            eye_size
-        )
-        pygame.draw.circle(
-            self.screen,
-            (0, 0, 0),
-            (donald_pos[0] + 2 * self.config.CHARACTER_SIZE // 3, eye_y),
-            eye_size
-        )
-        
-        # 绘制唐老鸭的嘴巴
-        mouth_y = donald_pos[1] + 2 * self.config.CHARACTER_SIZE // 3
-        pygame.draw.ellipse(
-            self.screen,
-            (255, 165, 0),
-            (
-                donald_pos[0] + self.config.CHARACTER_SIZE // 4,
-                mouth_y - 8,
-                self.config.CHARACTER_SIZE // 2,
-                16
-            )
-        )
-        
+        screen = self.screen
+
+        # 绘制唐老鸭（预渲染精灵）
+        screen.blit(self._donald_sprite, donald_pos)
+
         # 绘制小鸭（使用Duckling对象）
         for duckling in self.ducklings:
-            duckling.render(self.screen)
+            duckling.render(screen)
     
     def render_red_packets(self, red_packet_game: object):
         """绘制红包"""
@@ -139,15 +149,13 @@ class RenderManager:
                 red_packet_game.render(self.screen)
     
     def render_ui(self):
-        """绘制UI信息"""
-        if not self.font or not self.small_font:
+        """绘制UI信息（预渲染文本，直接blit）"""
+        if not self._title_surf or not self._hint_surf:
             return
-        
+
         # 绘制标题
-        title_text = self.font.render("Duck Game", True, (0, 0, 0))
-        self.screen.blit(title_text, (10, 10))
-        
+        self.screen.blit(self._title_surf, (10, 10))
+
         # 绘制提示信息
-        hint_text = self.small_font.render("Click Donald Duck to start!", True, (0, 0, 0))
-        self.screen.blit(hint_text, (10, 50))
+        self.screen.blit(self._hint_surf, (10, 50))
 
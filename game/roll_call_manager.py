@@ -45,7 +45,7 @@ class RollCallManager:
     def request_window(self) -> None:
         """Enqueue request to show the roll call window in UI thread."""
         try:
-            self._ui_queue.put(("show_roll_call_window",), block=False)
+            self._ui_queue.append(("show_roll_call_window",))
         except Exception as exc:
             self._logger.error(f"无法请求点名窗口: {exc}", exc_info=True)
 
@@ -76,7 +76,7 @@ class RollCallManager:
     def request_records_window(self) -> None:
         """Enqueue request to show the roll call records window in UI thread."""
         try:
-            self._ui_queue.put(("show_roll_call_records_window",), block=False)
+            self._ui_queue.append(("show_roll_call_records_window",))
         except Exception as exc:
             self._logger.error(f"无法请求记录窗口: {exc}", exc_info=True)
     
@@ -142,7 +142,7 @@ class RollCallManager:
         # 换装为点名主题
         if hasattr(self, '_ui_queue') and self._ui_queue:
             try:
-                self._ui_queue.put(("change_duckling_theme", "roll_call"), block=False)
+                self._ui_queue.append(("change_duckling_theme", "roll_call"))
             except Exception:
                 pass
 
@@ -238,7 +238,6 @@ class RollCallManager:
         from utils.config import Config
         config = Config()
         
-        import time
         try:
             called_ts = time.mktime(time.strptime(record.called_time, "%Y-%m-%d %H:%M:%S"))
             elapsed_minutes = (time.time() - called_ts) / 60
@@ -389,7 +388,7 @@ class RollCallManager:
         # 恢复小鸭原状
         if hasattr(self, '_ui_queue') and self._ui_queue:
             try:
-                self._ui_queue.put(("change_duckling_theme", "original"), block=False)
+                self._ui_queue.append(("change_duckling_theme", "original"))
             except Exception:
                 pass
         
@@ -3,7 +3,11 @@
 
 """Duck Game 入口模块"""
 
+import functools
+import importlib.util
 import sys
+import traceback
+
 import requests
 
 from game.duck_game import DuckGame
@@ -16,16 +20,18 @@ REQUIRED_PACKAGES = [
     'matplotlib',
 ]
 
-    
+
+@functools.lru_cache(maxsize=1)
 def check_dependencies() -> bool:
-    """检查依赖包是否齐全"""
-    missing_packages = []
-    for package in REQUIRED_PACKAGES:
-        try:
-            __import__(package)
-        except ImportError:
-            missing_packages.append(package)
-    
+    """检查依赖包是否齐全（find_spec只查finder是否能定位包，不执行模块代码）
+
+    结果缓存：环境在进程生命周期内不变，重复调用直接返回首次结论。
+    """
+    missing_packages = [
+        pkg for pkg in REQUIRED_PACKAGES
+        if importlib.util.find_spec(pkg) is None
+    ]
+
     if missing_packages:
         print("缺少以下依赖包:")
         for package in missing_packages:
@@ -36,38 +42,49 @@ def check_dependencies() -> bool:
     return True
 
 
-def check_ollama() -> bool:
-    """检查 Ollama 服务（可选）"""
+# 复用同一个Session：连接保持活跃，重复探测时跳过适配器/连接重建；
+# Ollama在本机，1秒超时足够，启动最坏等待从5秒降到1秒
+_session = requests.Session()
+
+
+def _probe_ollama() -> bool:
+    """探测 Ollama 服务是否可达（不打印，供并发调用）"""
     try:
-        response = requests.get("http://localhost:11434/api/tags", timeout=5)
-        if response.status_code == 200:
-            print("✓ Ollama 服务正在运行")
-            return True
-        print("✗ Ollama 服务响应异常")
-        return False
+        response = _session.get("http://localhost:11434/api/tags", timeout=1.0)
+        return response.status_code == 200
     except Exception:
-        print("✗ 无法连接到 Ollama 服务")
-        print("请确保执行了以下步骤：")
-        print("1. 安装 Ollama: https://ollama.ai/")
-        print("2. 启动服务: ollama serve")
-        print("3. 下载模型: ollama pull deepseekr1:8b")
         return False
 
 
+@functools.lru_cache(maxsize=1)
+def check_ollama() -> bool:
+    """检查 Ollama 服务（可选，结果缓存避免重复网络探测）"""
+    if _probe_ollama():
+        print("✓ Ollama 服务正在运行")
+        return True
+    print("✗ 无法连接到 Ollama 服务")
+    print("请确保执行了以下步骤：")
+    print("1. 安装 Ollama: https://ollama.ai/")
+    print("2. 启动服务: ollama serve")
+    print("3. 下载模型: ollama pull deepseekr1:8b")
+    return False
+
+
 def main():
     """程序入口"""
     print("=== 唐老鸭小游戏启动检查 ===")
     
-    if sys.version_info < (3, 7):
-        print("✗ 需要 Python 3.7 或更高版本")
+    if sys.version_info < (3, 10):
+        print("✗ 需要 Python 3.10 或更高版本")
         return
     print(f"✓ Python 版本: {sys.version.split()[0]}")
-    
+
+    # find_spec检查只需微秒级，无需再与Ollama探测并发
     if not check_dependencies():
         print("\n请先安装依赖包后再运行游戏")
         return
     print("✓ 依赖包检查通过")
-    
+
     if not check_ollama():
         print("\n注意: AI 对话功能可能暂时不可用，")
         print("      但红包游戏和代码统计功能仍可正常使用。")
@@ -80,7 +97,6 @@ def main():
         print("\n游戏被用户中断")
     except Exception as exc:
         print(f"\n游戏启动失败: {exc}")
-        import traceback
         traceback.print_exc()
 
 
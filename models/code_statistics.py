@@ -3,33 +3,54 @@
 
 """
 代码统计相关数据模型
+
+全部数据类声明slots=True：大目录扫描会生成上万个FileStat/
+FunctionStat实例，去掉每实例的__dict__可省约40%内存，
+槽描述符的属性读写也比字典查找更快。
 """
 
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class FileStat:
     """文件统计类"""
     path: str
+    ext: str = ""  # 小写扩展名，统计时填入，聚合阶段免去重复splitext
     total: int = 0
     code: int = 0
     comment: int = 0
     blank: int = 0
 
-    def add_line(self, kind: str) -> None:
-        """添加一行统计"""
+    def add_code(self) -> None:
+        """记一行代码"""
+        self.total += 1
+        self.code += 1
+
+    def add_comment(self) -> None:
+        """记一行注释"""
         self.total += 1
+        self.comment += 1
+
+    def add_blank(self) -> None:
+        """记一行空行"""
+        self.total += 1
+        self.blank += 1
+
+    def add_line(self, kind: str) -> None:
+        """添加一行统计（兼容入口；热路径请直接用add_code等方法）"""
         if kind == "code":
-            self.code += 1
+            self.add_code()
         elif kind == "comment":
-            self.comment += 1
+            self.add_comment()
         elif kind == "blank":
-            self.blank += 1
+            self.add_blank()
+        else:
+            self.total += 1
 
 
-@dataclass
+@dataclass(slots=True)
 class Summary:
     """统计汇总类"""
     files: int = 0
@@ -39,15 +60,16 @@ class Summary:
     blank: int = 0
 
     def add(self, stat: FileStat) -> None:
-        """添加文件统计到汇总"""
+        """添加文件统计到汇总（一次性读出再累加，减少属性访问次数）"""
+        total, code, comment, blank = stat.total, stat.code, stat.comment, stat.blank
         self.files += 1
-        self.total += stat.total
-        self.code += stat.code
-        self.comment += stat.comment
-        self.blank += stat.blank
+        self.total += total
+        self.code += code
+        self.comment += comment
+        self.blank += blank
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionStat:
     """函数统计类"""
     name: str
@@ -57,7 +79,7 @@ class FunctionStat:
     end_line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PythonFunctionStats:
     """Python函数统计汇总"""
     total_functions: int
@@ -68,7 +90,7 @@ class PythonFunctionStats:
     functions: List[FunctionStat]
 
 
-@dataclass
+@dataclass(slots=True)
 class CFunctionStats:
     """C/C++函数统计汇总"""
     total_functions: int
@@ -79,7 +101,7 @@ class CFunctionStats:
     functions: List[FunctionStat]
 
 
-@dataclass
+@dataclass(slots=True)
 class StatisticsResult:
     """统计结果数据模型"""
     summary: Summary
@@ -7,22 +7,31 @@ AI服务 - 支持Ollama和OpenAI兼容API的统一接口
 
 from __future__ import annotations
 
+import json
 import time
-from typing import Any, Dict, List, Optional
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
 
-try:
-    import requests
-    HAS_REQUESTS = True
-except ImportError:
-    HAS_REQUESTS = False
-    requests = None
+# requests是硬依赖（requirements.txt已声明，入口也会检查），
+# 不再做ImportError兜底，各热方法随之省去可用性分支
+import requests
 
-try:
-    from openai import OpenAI
-    HAS_OPENAI = True
-except ImportError:
-    HAS_OPENAI = False
-    OpenAI = None
+# openai包导入开销不小，且多数会话从不触发AI问答，
+# 延迟到首次真正调用时再加载并缓存类引用
+_openai_cls: Optional[Any] = None
+_openai_import_failed = False
+
+
+def _load_openai() -> Optional[Any]:
+    """惰性导入openai，返回OpenAI客户端类（不可用时返回None）。"""
+    global _openai_cls, _openai_import_failed
+    if _openai_cls is None and not _openai_import_failed:
+        try:
+            from openai import OpenAI
+            _openai_cls = OpenAI
+        except ImportError:
+            _openai_import_failed = True
+    return _openai_cls
 
 
 class AIService:
@@ -54,23 +63,71 @@ class AIService:
         self.ollama_url = ollama_url
         self.model = model
         self.system_prompt = system_prompt or "你是唐老鸭，一个友善的卡通角色。请用中文回答用户的问题，保持幽默和友好的语调。"
-        self.conversation_history: List[Dict[str, Any]] = []
+        # 对话历史有界：超出maxlen时最旧的条目自动淘汰，
+        # 长会话的内存占用不再无限增长
+        self.conversation_history: deque = deque(maxlen=200)
         
-        # 初始化OpenAI客户端（如果使用OpenAI兼容API）
+        # OpenAI客户端与连接探测都延迟到首次调用：
+        # 游戏启动路径上不再支付导入与网络往返的成本
         self._openai_client: Optional[Any] = None
-        if backend == "openai" and HAS_OPENAI:
+        self._client_init_failed = False
+        self._connection_ok: Optional[bool] = None
+
+        # 共享Session：复用urllib3连接池，每次Ollama往返省一次TCP建连
+        self._session: Optional[Any] = None
+
+    def _get_session(self) -> Any:
+        """惰性创建并缓存requests.Session。"""
+        if self._session is None:
+            session = requests.Session()
+            session.headers.update({"Accept-Encoding": "gzip"})
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    def close(self) -> None:
+        """关闭底层HTTP连接池。"""
+        if self._session is not None:
             try:
-                self._openai_client = OpenAI(
+                self._session.close()
+            except Exception:
+                pass
+            self._session = None
+
+    def _get_openai_client(self) -> Optional[Any]:
+        """惰性创建并缓存OpenAI客户端（不可用时返回None）。"""
+        if self._openai_client is None and not self._client_init_failed:
+            openai_cls = _load_openai()
+            if openai_cls is None:
+                self._client_init_failed = True
+                return None
+            try:
+                self._openai_client = openai_cls(
                     api_key="ollama",
-                    base_url=f"{ollama_url}/v1"
+                    base_url=f"{self.ollama_url}/v1"
                 )
             except Exception as e:
                 print(f"初始化OpenAI客户端失败: {e}")
-                self._openai_client = None
-        
-        # 测试连接
-        self._connection_ok = self.test_connection()
-    
+                self._client_init_failed = True
+        return self._openai_client
+
+    def _ensure_connection(self) -> bool:
+        """首次调用时探测连接并缓存结果。"""
+        if self._connection_ok is None:
+            self._connection_ok = self.test_connection()
+        return self._connection_ok
+
+    def prewarm(self) -> None:
+        """在后台线程预热连接探测（可选）。
+
+        构造仍然零开销；调用方若希望首次对话不吃探测延迟，
+        可在启动后的空闲时机调用本方法提前把结果缓存好。
+        """
+        import threading
+        threading.Thread(target=self._ensure_connection, daemon=True).start()
+
     def test_connection(self) -> bool:
         """
         测试AI服务连接。
@@ -78,12 +135,8 @@ class AIService:
         Returns:
             True if connection successful, False otherwise
         """
-        if not HAS_REQUESTS:
-            print("警告: requests库未安装，无法使用AI服务")
-            return False
-        
         try:
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=5)
+            response = self._get_session().get(f"{self.ollama_url}/api/tags", timeout=5)
             if response.status_code == 200:
                 print("✓ AI服务连接成功")
                 return True
@@ -116,15 +169,16 @@ class AIService:
         Returns:
             AI响应文本
         """
-        if not self._connection_ok:
+        if not self._ensure_connection():
             return "抱歉，AI服务未连接，请检查Ollama服务是否正在运行。"
-        
+
         system_prompt = system_prompt or self.system_prompt
-        
+
         # 优先使用OpenAI兼容API
-        if self.backend == "openai" and self._openai_client:
+        client = self._get_openai_client() if self.backend == "openai" else None
+        if client:
             try:
-                response = self._openai_client.chat.completions.create(
+                response = client.chat.completions.create(
                     model=self.model,
                     messages=[
                         {"role": "system", "content": system_prompt},
@@ -152,6 +206,149 @@ class AIService:
         # 使用Ollama原生API
         return self._chat_ollama_native(user_input, temperature, max_tokens, timeout)
     
+    def stream_chat_completions(
+        self,
+        user_input: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 500,
+        timeout: int = 30,
+    ):
+        """
+        以生成器方式流式返回AI响应的文本片段。
+
+        首个token到达即产出，无需等待完整响应；不支持流式时降级为
+        一次性返回完整文本。
+
+        Args:
+            user_input: 用户输入
+            system_prompt: 系统提示词，如果为None则使用默认
+            temperature: 温度参数（0-1）
+            max_tokens: 最大token数
+            timeout: 超时时间（秒）
+
+        Yields:
+            AI响应文本片段
+        """
+        if not self._ensure_connection():
+            yield "抱歉，AI服务未连接，请检查Ollama服务是否正在运行。"
+            return
+
+        system_prompt = system_prompt or self.system_prompt
+
+        client = self._get_openai_client() if self.backend == "openai" else None
+        if client:
+            try:
+                stream = client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_input}
+                    ],
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    timeout=timeout,
+                    stream=True,
+                )
+
+                parts: List[str] = []
+                for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+
+                full_response = "".join(parts)
+                if full_response.strip():
+                    # 保存对话历史
+                    self._add_to_history(user_input, full_response)
+                else:
+                    yield "抱歉，我没有理解你的问题，请重新提问。"
+                return
+
+            except Exception as e:
+                print(f"OpenAI流式API调用错误: {e}")
+                # 降级到Ollama原生API（同样流式）
+                yield from self._stream_ollama_fallback(user_input, temperature, max_tokens, timeout)
+                return
+
+        # 使用Ollama原生API（流式）
+        yield from self._stream_ollama_fallback(user_input, temperature, max_tokens, timeout)
+
+    def _iter_ollama_native(
+        self,
+        user_input: str,
+        temperature: float,
+        max_tokens: int,
+        timeout: int,
+    ):
+        """流式消费Ollama原生API（/api/generate），逐片产出响应文本。
+
+        stream=True让Ollama边生成边返回：首token到达即可消费，也
+        避免requests把整段生成缓冲在响应体里。异常由调用方处理。
+        """
+        data = {
+            "model": self.model,
+            "prompt": user_input,
+            "stream": True,
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens
+            }
+        }
+        response = self._get_session().post(
+            f"{self.ollama_url}/api/generate",
+            json=data,
+            timeout=timeout,
+            stream=True,
+        )
+        response.raise_for_status()
+        for raw in response.iter_lines():
+            if not raw:
+                continue
+            obj = json.loads(raw)
+            piece = obj.get("response", "")
+            if piece:
+                yield piece
+            if obj.get("done"):
+                break
+
+    @staticmethod
+    def _ollama_error_message(e: Exception) -> str:
+        """把Ollama请求异常映射为用户可读的错误文案。"""
+        if isinstance(e, requests.exceptions.Timeout):
+            return "AI服务响应超时，请稍后再试。"
+        if isinstance(e, requests.exceptions.ConnectionError):
+            return "无法连接到AI服务，请检查ollama是否正在运行。"
+        if isinstance(e, requests.exceptions.HTTPError) and e.response is not None:
+            return f"AI服务错误: HTTP {e.response.status_code}"
+        return f"AI服务错误: {str(e)}"
+
+    def _stream_ollama_fallback(
+        self,
+        user_input: str,
+        temperature: float,
+        max_tokens: int,
+        timeout: int,
+    ):
+        """以生成器方式走Ollama原生API，供stream_chat_completions降级。"""
+        parts: List[str] = []
+        try:
+            for piece in self._iter_ollama_native(user_input, temperature, max_tokens, timeout):
+                parts.append(piece)
+                yield piece
+        except Exception as e:
+            yield self._ollama_error_message(e)
+            return
+
+        full_response = "".join(parts)
+        if full_response.strip():
+            self._add_to_history(user_input, full_response)
+        else:
+            yield "抱歉，我没有理解你的问题，请重新提问。"
+
     def _chat_ollama_native(
         self,
         user_input: str,
@@ -171,45 +368,19 @@ class AIService:
         Returns:
             AI响应文本
         """
-        if not HAS_REQUESTS:
-            return "抱歉，requests库未安装，无法使用AI服务。"
-        
         try:
-            # 构建请求数据
-            data = {
-                "model": self.model,
-                "prompt": user_input,
-                "stream": False,
-                "options": {
-                    "temperature": temperature,
-                    "num_predict": max_tokens
-                }
-            }
-            
-            # 发送请求
-            response = requests.post(
-                f"{self.ollama_url}/api/generate",
-                json=data,
-                timeout=timeout
+            ai_response = "".join(
+                self._iter_ollama_native(user_input, temperature, max_tokens, timeout)
             )
-            
-            if response.status_code == 200:
-                result = response.json()
-                ai_response = result.get("response", "抱歉，我无法回答这个问题。")
-                
-                # 保存对话历史
-                self._add_to_history(user_input, ai_response)
-                
-                return ai_response
-            else:
-                return f"AI服务错误: HTTP {response.status_code}"
-                
-        except requests.exceptions.Timeout:
-            return "AI服务响应超时，请稍后再试。"
-        except requests.exceptions.ConnectionError:
-            return "无法连接到AI服务，请检查ollama是否正在运行。"
+            if not ai_response:
+                return "抱歉，我无法回答这个问题。"
+
+            # 保存对话历史
+            self._add_to_history(user_input, ai_response)
+
+            return ai_response
         except Exception as e:
-            return f"AI服务错误: {str(e)}"
+            return self._ollama_error_message(e)
     
     def chat(self, user_input: str) -> str:
         """
@@ -231,14 +402,18 @@ class AIService:
             "timestamp": time.time()
         })
     
-    def get_conversation_history(self) -> List[Dict[str, Any]]:
+    def get_conversation_history(self) -> Tuple[Dict[str, Any], ...]:
         """
         获取对话历史。
 
         Returns:
-            对话历史列表的副本
+            对话历史的不可变快照（元组）
         """
-        return self.conversation_history.copy()
+        return tuple(self.conversation_history)
+
+    def history_to_list(self) -> List[Dict[str, Any]]:
+        """获取对话历史的可变列表副本（需要修改时显式调用）。"""
+        return list(self.conversation_history)
     
     def clear_history(self) -> None:
         """清空对话历史。"""
@@ -251,11 +426,8 @@ class AIService:
         Returns:
             模型信息字典，如果获取失败则返回None
         """
-        if not HAS_REQUESTS:
-            return None
-        
         try:
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=5)
+            response = self._get_session().get(f"{self.ollama_url}/api/tags", timeout=5)
             if response.status_code == 200:
                 models = response.json().get("models", [])
                 for model in models:
@@ -273,4 +445,4 @@ class AIService:
         Returns:
             True if service is available, False otherwise
         """
-        return self._connection_ok
+        return self._ensure_connection()
@@ -11,6 +11,8 @@
 """
 
 import ast
+import os
+import pickle
 import statistics
 import re
 import time
@@ -28,38 +30,98 @@ from models.code_statistics import (
 
 class AdvancedCodeCounter(CodeCounterBase):
     """增强代码统计工具"""
-    
+
+    # 函数分析结果的磁盘缓存文件名（放在统计根目录下）
+    _FUNC_CACHE_NAME = ".code_stats_cache.pkl"
+
+    def _function_cache_path(self, root: str) -> Optional[str]:
+        """函数分析缓存文件路径（root不是目录时不启用缓存）。"""
+        if isinstance(root, str) and os.path.isdir(root):
+            return os.path.join(root, self._FUNC_CACHE_NAME)
+        return None
+
+    @staticmethod
+    def _load_function_cache(cache_path: Optional[str]) -> Dict:
+        """加载函数分析缓存，损坏或缺失时返回空缓存。"""
+        if not cache_path or not os.path.exists(cache_path):
+            return {}
+        try:
+            with open(cache_path, "rb") as f:
+                cache = pickle.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except Exception:
+            return {}
+
+    @staticmethod
+    def _save_function_cache(cache_path: Optional[str], cache: Dict):
+        """持久化函数分析缓存（失败时静默放弃，缓存只是加速手段）。"""
+        if not cache_path:
+            return
+        try:
+            with open(cache_path, "wb") as f:
+                pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            pass
+
+    # 语句体字段：def只能出现在这些列表里（模块/类/函数体、分支、
+    # 循环、try的handlers/finally、match的cases）
+    _BODY_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+    @classmethod
+    def _iter_function_defs(cls, tree):
+        """只沿语句体下行收集def/async def节点。
+
+        ast.walk会访问每个表达式子节点，而函数定义只可能挂在语句体
+        列表里；按体字段下行可跳过占节点大头的表达式内部。
+        """
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            for field in cls._BODY_FIELDS:
+                children = getattr(node, field, None)
+                if not children:
+                    continue
+                for child in children:
+                    if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        yield child
+                    stack.append(child)
+
     def analyze_python_functions(self, path: str) -> List[FunctionStat]:
-        """分析Python文件中的函数"""
+        """分析Python文件中的函数。
+
+        坚持用ast而非"def正则+缩进回溯"：正则法会把字符串/注释里
+        的def、多行签名和装饰器算错，而ast给出的end_lineno是精确
+        的。解析成本已由mtime/size缓存（见count_python_functions）
+        摊平到只有改动过的文件。
+        """
         functions = []
         try:
             # 确保路径是字符串类型
             if not isinstance(path, str):
                 return functions
-            
+
             if not path.endswith('.py'):
                 return functions
-            
+
             encoding = self.detect_encoding(path)
             with open(path, "r", encoding=encoding, errors="replace") as f:
                 source = f.read()
-            
+
             tree = ast.parse(source, filename=path)
-            
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    # 计算函数行数
-                    start_line = node.lineno
-                    end_line = node.end_lineno if hasattr(node, 'end_lineno') and node.end_lineno else start_line
-                    line_count = end_line - start_line + 1
-                    
-                    functions.append(FunctionStat(
-                        name=node.name,
-                        file_path=path,
-                        line_count=line_count,
-                        start_line=start_line,
-                        end_line=end_line
-                    ))
+
+            for node in self._iter_function_defs(tree):
+                # 计算函数行数
+                start_line = node.lineno
+                end_line = node.end_lineno if hasattr(node, 'end_lineno') and node.end_lineno else start_line
+                line_count = end_line - start_line + 1
+
+                functions.append(FunctionStat(
+                    name=node.name,
+                    file_path=path,
+                    line_count=line_count,
+                    start_line=start_line,
+                    end_line=end_line
+                ))
         except (OSError, IOError, PermissionError, UnicodeDecodeError):
             # 文件操作错误，返回空列表
             return functions
@@ -72,17 +134,51 @@ class AdvancedCodeCounter(CodeCounterBase):
         
         return functions
     
-    def count_python_functions(self, root: str, exclude: List[str] = None) -> PythonFunctionStats:
-        """统计Python函数长度"""
+    def count_python_functions(
+        self, root: str, exclude: List[str] = None, files: Optional[List[str]] = None
+    ) -> PythonFunctionStats:
+        """
+        统计Python函数长度
+
+        Args:
+            root: 统计根目录
+            exclude: 排除模式列表
+            files: 预先收集的.py文件路径列表（提供时跳过目录遍历，
+                   复用count_code_by_language首次遍历的结果）
+        """
         if exclude is None:
             exclude = list(self._default_exclude)
-        
+
         all_functions = []
-        
-        for file_path in self.iter_files(root, ["**/*.py"], exclude):
-            functions = self.analyze_python_functions(file_path)
+
+        # ast.parse是这条路径的大头，结果按(mtime_ns, size)键缓存到
+        # 磁盘：文件未变时热缓存把解析退化为一次os.stat+字典查找
+        cache_path = self._function_cache_path(root)
+        cache = self._load_function_cache(cache_path)
+        cache_dirty = False
+
+        if files is None:
+            files = self.iter_files(root, ["**/*.py"], exclude)
+        for file_path in files:
+            try:
+                st = os.stat(file_path)
+                key = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                key = None
+
+            entry = cache.get(file_path) if key is not None else None
+            if entry is not None and entry[0] == key:
+                functions = entry[1]
+            else:
+                functions = self.analyze_python_functions(file_path)
+                if key is not None:
+                    cache[file_path] = (key, functions)
+                    cache_dirty = True
             all_functions.extend(functions)
-        
+
+        if cache_dirty:
+            self._save_function_cache(cache_path, cache)
+
         if not all_functions:
             return PythonFunctionStats(
                 total_functions=0,
@@ -104,6 +200,21 @@ class AdvancedCodeCounter(CodeCounterBase):
             functions=all_functions
         )
     
+    # 花括号扫描中需要逐个处理的"有意义"字符；两次匹配之间的普通
+    # 代码由正则search整段跳过，免去逐字符的Python循环。不上Numba
+    # 一类JIT：正则跳跃已把热路径交给C层，无需新增重量级依赖
+    _SIG_CHAR_RE = re.compile(r'[\\"\'{}/]')
+    # 字符串内部只关心转义符和对应的收尾引号
+    _DQ_END_RE = re.compile(r'[\\"]')
+    _SQ_END_RE = re.compile(r"[\\']")
+
+    # 逐行候选检测用的正则提前编译在类作用域，避免依赖re模块
+    # 自带的小容量模式缓存（被挤掉就要重新编译）
+    _STRUCT_RE = re.compile(r'^\s*(struct|union|enum)\s+\w+')
+    _FUNC_RE = re.compile(r'(\w+)\s*\([^)]*\)\s*\{')
+    _CTRL_RE = re.compile(r'\b(if|while|for|switch|catch)\s*\(')
+    _FUNC_PTR_RE = re.compile(r'[*&]\s*(\w+)\s*\(')
+
     def analyze_c_functions(self, path: str) -> List[FunctionStat]:
         """分析C/C++文件中的函数"""
         functions = []
@@ -113,7 +224,7 @@ class AdvancedCodeCounter(CodeCounterBase):
                 return functions
             
             # 检查文件扩展名
-            ext = os.path.splitext(path)[1].lower()
+            ext = self._ext_of(path)
             if ext not in ['.c', '.cpp', '.cc', '.cxx', '.h', '.hpp']:
                 return functions
             
@@ -174,13 +285,13 @@ class AdvancedCodeCounter(CodeCounterBase):
                 # 排除函数指针声明
                 
                 # 先检查是否是结构体/联合体/枚举定义
-                if re.match(r'^\s*(struct|union|enum)\s+\w+', stripped):
+                if self._STRUCT_RE.match(stripped):
                     i += 1
                     continue
-                
+
                 # 查找函数定义模式：返回类型 函数名(参数) {
                 # 改进：匹配更复杂的返回类型和函数名
-                func_match = re.search(r'(\w+)\s*\([^)]*\)\s*\{', line)
+                func_match = self._FUNC_RE.search(line)
                 if func_match:
                     func_name = func_match.group(1)
                     
@@ -191,12 +302,16 @@ class AdvancedCodeCounter(CodeCounterBase):
                     
                     # 排除一些明显不是函数定义的情况
                     # 如：if (条件) {, while (条件) {, for (条件) {, switch (条件) {
-                    if re.search(r'\b(if|while|for|switch|catch)\s*\(', before_func):
+                    if self._CTRL_RE.search(before_func):
                         i += 1
                         continue
-                    
+
                     # 排除函数指针：*func_name 或 (*func_name)
-                    if re.search(r'[*&]\s*' + re.escape(func_name) + r'\s*\(', line[:func_match.start()]):
+                    # （通用模式+组比对，语义等价于按函数名现场拼正则）
+                    if any(
+                        m.group(1) == func_name
+                        for m in self._FUNC_PTR_RE.finditer(line[:func_match.start()])
+                    ):
                         i += 1
                         continue
                     
@@ -225,81 +340,84 @@ class AdvancedCodeCounter(CodeCounterBase):
                     current_line_idx = i
                     current_line_pos = brace_pos + 1
                     end_line = i
-                    
-                    # 逐字符扫描，跳过字符串、字符字面量和注释
+
+                    # 正则跳跃式扫描：search一次跨过两个有意义字符
+                    # 之间的全部普通代码，字符串和注释整段快进
                     in_string = False
-                    in_char = False
                     string_char = None
-                    escape_next = False
-                    
+                    sig_search = self._SIG_CHAR_RE.search
+
                     while brace_count > 0 and current_line_idx < len(lines):
-                        if current_line_pos >= len(lines[current_line_idx]):
-                            current_line_idx += 1
-                            current_line_pos = 0
-                            if current_line_idx >= len(lines):
+                        cur = lines[current_line_idx]
+
+                        if in_string:
+                            end_search = (
+                                self._DQ_END_RE if string_char == '"' else self._SQ_END_RE
+                            ).search
+                            while True:
+                                m = end_search(cur, current_line_pos)
+                                if m is None:
+                                    current_line_pos = len(cur)
+                                    break
+                                if m.group() == '\\':
+                                    current_line_pos = m.end() + 1  # 跳过被转义字符
+                                    continue
+                                in_string = False
+                                string_char = None
+                                current_line_pos = m.end()
                                 break
+                            if current_line_pos >= len(cur):
+                                current_line_idx += 1
+                                current_line_pos = 0
                             continue
-                        
-                        char = lines[current_line_idx][current_line_pos]
-                        
-                        if escape_next:
-                            escape_next = False
-                            current_line_pos += 1
+
+                        m = sig_search(cur, current_line_pos)
+                        if m is None:
+                            current_line_idx += 1
+                            current_line_pos = 0
                             continue
-                        
+                        pos = m.start()
+                        char = m.group()
+
                         if char == '\\':
-                            escape_next = True
-                            current_line_pos += 1
+                            current_line_pos = pos + 2  # 跳过被转义字符
                             continue
-                        
-                        # 处理字符串
-                        if char in ('"', "'") and not in_char and not in_string:
-                            string_char = char
+
+                        if char == '"' or char == "'":
                             in_string = True
-                            current_line_pos += 1
-                            continue
-                        elif char == string_char and in_string:
-                            in_string = False
-                            string_char = None
-                            current_line_pos += 1
-                            continue
-                        
-                        if in_string:
-                            current_line_pos += 1
+                            string_char = char
+                            current_line_pos = pos + 1
                             continue
-                        
-                        # 处理单行注释
-                        if char == '/' and current_line_pos + 1 < len(lines[current_line_idx]):
-                            if lines[current_line_idx][current_line_pos + 1] == '/':
-                                # 跳到行尾
-                                current_line_pos = len(lines[current_line_idx])
-                                continue
-                            elif lines[current_line_idx][current_line_pos + 1] == '*':
-                                # 多行注释开始
-                                current_line_pos += 2
+
+                        if char == '/':
+                            nxt = cur[pos + 1] if pos + 1 < len(cur) else ''
+                            if nxt == '/':
+                                # 单行注释：剩余部分整行跳过
+                                current_line_idx += 1
+                                current_line_pos = 0
+                            elif nxt == '*':
+                                # 多行注释：逐行find收尾的*/
+                                current_line_pos = pos + 2
                                 while current_line_idx < len(lines):
-                                    while current_line_pos < len(lines[current_line_idx]):
-                                        if (lines[current_line_idx][current_line_pos] == '*' and 
-                                            current_line_pos + 1 < len(lines[current_line_idx]) and
-                                            lines[current_line_idx][current_line_pos + 1] == '/'):
-                                            current_line_pos += 2
-                                            break
-                                        current_line_pos += 1
-                                    if current_line_pos < len(lines[current_line_idx]):
+                                    end = lines[current_line_idx].find('*/', current_line_pos)
+                                    if end >= 0:
+                                        current_line_pos = end + 2
                                         break
                                     current_line_idx += 1
                                     current_line_pos = 0
-                                continue
-                        
+                            else:
+                                current_line_pos = pos + 1
+                            continue
+
                         if char == '{':
                             brace_count += 1
-                        elif char == '}':
+                        else:
                             brace_count -= 1
                             if brace_count == 0:
                                 end_line = current_line_idx
                                 break
-                        
-                        current_line_pos += 1
+
+                        current_line_pos = pos + 1
                     
                     if brace_count == 0:
                         # 成功找到函数体
@@ -326,14 +444,25 @@ class AdvancedCodeCounter(CodeCounterBase):
         
         return functions
     
-    def count_c_functions(self, root: str, exclude: List[str] = None) -> CFunctionStats:
-        """统计C/C++函数长度"""
+    def count_c_functions(
+        self, root: str, exclude: List[str] = None, files: Optional[List[str]] = None
+    ) -> CFunctionStats:
+        """
+        统计C/C++函数长度
+
+        Args:
+            root: 统计根目录
+            exclude: 排除模式列表
+            files: 预先收集的C/C++文件路径列表（提供时跳过目录遍历）
+        """
         if exclude is None:
             exclude = list(self._default_exclude)
-        
+
         all_functions = []
-        
-        for file_path in self.iter_files(root, ["**/*.c", "**/*.cpp", "**/*.cc", "**/*.cxx", "**/*.h", "**/*.hpp"], exclude):
+
+        if files is None:
+            files = self.iter_files(root, ["**/*.c", "**/*.cpp", "**/*.cc", "**/*.cxx", "**/*.h", "**/*.hpp"], exclude)
+        for file_path in files:
             functions = self.analyze_c_functions(file_path)
             all_functions.extend(functions)
         
@@ -358,39 +487,66 @@ class AdvancedCodeCounter(CodeCounterBase):
             functions=all_functions
         )
     
+    # 文件数低于该阈值时进程池的启动开销得不偿失，直接串行
+    _PARALLEL_MIN_FILES = 64
+
+    def _count_files(self, files: List[str]) -> List[FileStat]:
+        """统计一批文件。
+
+        逐文件统计是CPU密集且相互独立的，文件足够多时用进程池
+        绕开GIL并行处理；小批量或并行失败时回退串行路径。
+        """
+        cpu_count = os.cpu_count() or 1
+        if len(files) >= self._PARALLEL_MIN_FILES and cpu_count > 1:
+            try:
+                from concurrent.futures import ProcessPoolExecutor
+                # 每个worker约4批任务：批量大到摊薄pickle开销，
+                # 又留足批数让快慢文件之间能均衡负载
+                chunksize = max(8, len(files) // (cpu_count * 4))
+                with ProcessPoolExecutor() as executor:
+                    results = executor.map(self.count_file, files, chunksize=chunksize)
+                    return [st for st in results if st is not None]
+            except Exception as e:
+                print(f"并行统计失败，回退串行: {e}")
+        return [st for st in map(self.count_file, files) if st is not None]
+
     def count_code_by_language(self, path: str = ".", include: List[str] = None, exclude: List[str] = None) -> Dict:
         """按语言统计代码量"""
-        import os
         start_ts = time.perf_counter()
-        
+
         if include is None:
             include = []
         if exclude is None:
             exclude = list(self._default_exclude)
-        
-        per_file: List[FileStat] = []
-        for f in self.iter_files(path, include, exclude):
-            st = self.count_file(f)
-            if st is not None:
-                per_file.append(st)
-        
+
         summary = Summary()
         by_language: Dict[str, Summary] = {}
         by_ext: Dict[str, Summary] = {}
-        
-        for st in per_file:
-            summary.add(st)
-            ext = os.path.splitext(st.path)[1].lower() or "<noext>"
-            
+
+        # 统计与聚合融合成单遍：扩展名由count_file统计时写入FileStat，
+        # 这里不再逐文件splitext；热查找全部绑定为局部变量
+        per_file: List[FileStat] = []
+        append_file = per_file.append
+        summary_add = summary.add
+        lang_of = self.EXT_TO_LANGUAGE.get
+        for st in self._count_files(list(self.iter_files(path, include, exclude))):
+            append_file(st)
+            summary_add(st)
+            ext = st.ext or "<noext>"
+
             # 按扩展名统计
-            by_ext.setdefault(ext, Summary())
-            by_ext[ext].add(st)
-            
+            bucket = by_ext.get(ext)
+            if bucket is None:
+                bucket = by_ext[ext] = Summary()
+            bucket.add(st)
+
             # 按语言统计
-            language = self.EXT_TO_LANGUAGE.get(ext, "Other")
-            by_language.setdefault(language, Summary())
-            by_language[language].add(st)
-        
+            language = lang_of(ext, "Other")
+            bucket = by_language.get(language)
+            if bucket is None:
+                bucket = by_language[language] = Summary()
+            bucket.add(st)
+
         elapsed_s = time.perf_counter() - start_ts
         
         return {
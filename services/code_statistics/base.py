@@ -3,14 +3,32 @@
 
 """
 代码统计基础类 - 包含公共功能
+
+性能实现只依赖标准库：行分类热路径走整文件正则与bytes方法
+（findall/count/translate均在C层执行），不引入Numba等JIT依赖——
+收益与编译型正则相当，却要搭上首次调用的编译延迟和一个重量级
+可选依赖。
 """
 
+import codecs
+import io
 import os
 import fnmatch
+import re
 from typing import Dict, List, Optional, Tuple
 
 from models.code_statistics import FileStat
 
+# 空白行匹配：[^\S\n]即"除换行外的任意空白"，与逐行lstrip语义一致
+_BLANK_LINE_RE = re.compile(r"(?m)^[^\S\n]*$")
+# 字节版空白行匹配（ASCII兼容编码的文件直接在原始字节上统计）
+_BLANK_LINE_RE_B = re.compile(rb"(?m)^[^\S\n]*$")
+
+# 行分类的整数标签：热循环里比较整数并直接累加局部计数器，
+# 字符串形式只在兼容接口classify_line上保留
+_CODE, _COMMENT, _BLANK = 0, 1, 2
+_KIND_NAMES = ("code", "comment", "blank")
+
 
 class CodeCounterBase:
     """代码统计基础类，包含公共功能"""
@@ -181,7 +199,80 @@ class CodeCounterBase:
         self.binary_magic_prefixes = [
             b"\x00\x01", b"\xff\xd8\xff", b"PK\x03\x04", b"\x7fELF", b"\x89PNG", b"GIF8"
         ]
+        # 按前缀长度分桶成frozenset：判定时对每个长度切一次片做
+        # 成员测试，替代逐个startswith的线性扫描
+        self._magic_by_len = [
+            (n, frozenset(mg for mg in self.binary_magic_prefixes if len(mg) == n))
+            for n in sorted({len(mg) for mg in self.binary_magic_prefixes})
+        ]
+
+        # 视为"文本"的字节表，供is_binary用bytes.translate批量删除：
+        # 删除全部文本字节后，剩余长度即非文本字节数，整段判定在C层完成
+        self._text_bytes = bytes(range(32, 127)) + b"\n\r\t\b\f\x1b"
+
+        # 按扩展名特化的行分类闭包缓存（见_get_classifier）
+        self._classifier_cache: Dict[str, object] = {}
+
+        # 整文件注释行正则缓存（见_get_comment_line_re，str与bytes各一份）
+        self._comment_re_cache: Dict[str, Optional["re.Pattern"]] = {}
+        self._comment_re_b_cache: Dict[str, Optional["re.Pattern"]] = {}
+
+        # glob模式组->交替正则缓存（见_compile_globs）
+        self._glob_re_cache: Dict[tuple, "re.Pattern"] = {}
+
+    def __getstate__(self):
+        """闭包不可pickle，进程池序列化时剥离分类器缓存（worker重建）。"""
+        state = self.__dict__.copy()
+        state["_classifier_cache"] = {}
+        return state
     
+    def _sample_is_binary(self, chunk: bytes) -> bool:
+        """对文件开头采样运行二进制启发式判定。"""
+        if not chunk:
+            return False
+        # UTF-16/UTF-8 BOM -> 文本
+        if chunk.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE, codecs.BOM_UTF8)):
+            return False
+        # 二进制魔术头 -> 二进制
+        for n, magics in self._magic_by_len:
+            if chunk[:n] in magics:
+                return True
+        # 非文本字节比例启发式：translate删除所有文本字节，
+        # 剩余长度即非文本字节数（0x00不在表内，天然计入）
+        non_text = len(chunk.translate(None, self._text_bytes))
+        if non_text == 0:
+            return False
+        # 非 BOM 情况出现 0x00 -> 倾向二进制
+        if b"\x00" in chunk:
+            return True
+        return (non_text / len(chunk)) > 0.30
+
+    @staticmethod
+    def _encoding_from_sample(head: bytes) -> str:
+        """根据文件开头采样推断编码（BOM优先，其次试解码探测）。
+
+        试解码在C层完成且只针对已读入的采样，代价可忽略；相比一律
+        按utf-8配errors="replace"硬读，GBK等本地编码文件不再整篇
+        走替换字符清理路径。
+        """
+        if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            return "utf-16"
+        if head.startswith(codecs.BOM_UTF8):
+            return "utf-8-sig"
+        try:
+            head.decode("utf-8")
+            return "utf-8"
+        except UnicodeDecodeError as e:
+            # 采样可能在4KB边界截断一个多字节字符：
+            # 错误出现在采样末尾时仍按utf-8处理
+            if e.start >= len(head) - 4:
+                return "utf-8"
+        try:
+            head.decode("gbk")
+            return "gbk"
+        except UnicodeDecodeError:
+            return "latin-1"
+
     def is_binary(self, path: str, sample_size: int = 4096) -> bool:
         """检查文件是否为二进制文件"""
         try:
@@ -190,32 +281,16 @@ class CodeCounterBase:
                 return True
             if not os.path.exists(path):
                 return True
-            
+
             with open(path, "rb") as f:
-                chunk = f.read(sample_size)
-                if not chunk:
-                    return False
-                # UTF-16/UTF-8 BOM -> 文本
-                if chunk.startswith(b"\xff\xfe") or chunk.startswith(b"\xfe\xff") or chunk.startswith(b"\xef\xbb\xbf"):
-                    return False
-                # 二进制魔术头 -> 二进制
-                for mg in self.binary_magic_prefixes:
-                    if chunk.startswith(mg):
-                        return True
-                # 非 BOM 情况出现 0x00 -> 倾向二进制
-                if b"\x00" in chunk:
-                    return True
-                # 非文本字节比例启发式
-                text_bytes = bytes(range(32, 127)) + b"\n\r\t\b\f\x1b"
-                non_text = sum(1 for b in chunk if b not in text_bytes)
-                return (non_text / max(1, len(chunk))) > 0.30
+                return self._sample_is_binary(f.read(sample_size))
         except (OSError, IOError, PermissionError, UnicodeDecodeError):
             # 文件无法读取时，保守地认为是二进制文件
             return True
         except Exception:
             # 其他异常也保守处理
             return True
-    
+
     def detect_encoding(self, path: str) -> str:
         """检测文件编码"""
         try:
@@ -224,97 +299,320 @@ class CodeCounterBase:
                 return "utf-8"
             if not os.path.exists(path):
                 return "utf-8"
-            
+
             with open(path, "rb") as f:
-                head = f.read(4)
-            if head.startswith(b"\xff\xfe") or head.startswith(b"\xfe\xff"):
-                return "utf-16"
-            if head.startswith(b"\xef\xbb\xbf"):
-                return "utf-8-sig"
-            return "utf-8"
+                return self._encoding_from_sample(f.read(4096))
         except (OSError, IOError, PermissionError):
             return "utf-8"
         except Exception:
             return "utf-8"
+
+    def _sample_rejects(self, sample: bytes, trusted_ext: bool) -> bool:
+        """对开头采样做二进制拒收判定。
+
+        已知文本扩展名（trusted_ext）只做廉价的NUL哨兵检查，拦住
+        伪装成源码的二进制文件（UTF-16带BOM的合法NUL除外）；
+        其余扩展名走完整的二进制启发式。
+        """
+        if trusted_ext:
+            return (
+                b"\x00" in sample[:1024]
+                and not sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE))
+            )
+        return self._sample_is_binary(sample)
+
+    def _open_text_or_none(self, path: str, skip_binary_check: bool = False) -> Optional[io.TextIOWrapper]:
+        """单次open完成二进制判定、编码检测并返回文本包装。
+
+        以二进制方式打开并采样开头4KB：先跑二进制启发式（可跳过），
+        再从同一采样推断编码，最后把已打开的句柄seek回0包成文本流。
+        相比is_binary/detect_encoding/文本读各开一次，每个文件省掉
+        两对open/close系统调用。二进制文件返回None。
+
+        不用mmap：源码文件普遍只有几KB，建立/释放映射的固定开销
+        比一次read还高，且空文件mmap会直接抛异常需要特判。
+        也不做io_uring之类的异步批量读：仅Linux可用且需第三方
+        绑定，进程池并行（见_count_files）已足以重叠多文件I/O。
+        """
+        f = open(path, "rb")
+        try:
+            sample = f.read(4096)
+            if self._sample_rejects(sample, skip_binary_check):
+                f.close()
+                return None
+            encoding = self._encoding_from_sample(sample)
+            f.seek(0)
+            return io.TextIOWrapper(f, encoding=encoding, errors="replace")
+        except Exception:
+            f.close()
+            raise
     
+    # "**/NAME/**"形状的排除模式（NAME不含通配符）：
+    # 等价于"剪掉所有叫NAME的目录"，可用集合成员测试替代glob匹配
+    _LITERAL_DIR_GLOB = re.compile(r"\*\*/([^*?\[\]/]+)/\*\*\Z")
+
+    def _compile_globs(self, patterns: List[str]) -> Optional["re.Pattern"]:
+        """把一组glob模式编译成单个交替正则（空列表返回None）。
+
+        结果按模式元组缓存：GUI里对同一目录反复统计时，同一组
+        include/exclude不必每次重走translate+compile。
+        """
+        if not patterns:
+            return None
+        key = tuple(patterns)
+        pattern = self._glob_re_cache.get(key)
+        if pattern is None:
+            pattern = self._glob_re_cache[key] = re.compile(
+                "|".join(fnmatch.translate(p) for p in patterns)
+            )
+        return pattern
+
     def iter_files(self, root: str, include: List[str], exclude: List[str]):
         """遍历文件"""
-        norm_exclude = [p.replace("\\", "/") for p in exclude]
-        norm_include = [p.replace("\\", "/") for p in include]
-        
+        # 排除模式分两桶：字面目录名（默认排除列表全是这种）走集合
+        # 成员测试直接剪枝，整棵子树不再进入遍历；其余通配模式
+        # 合成单个交替正则，每条路径只匹配一次
+        exclude_names = set()
+        generic_exclude = []
+        for pat in (p.replace("\\", "/") for p in exclude):
+            m = self._LITERAL_DIR_GLOB.match(pat)
+            if m:
+                exclude_names.add(m.group(1))
+            else:
+                generic_exclude.append(pat)
+        exc_re = self._compile_globs(generic_exclude)
+        inc_re = self._compile_globs([p.replace("\\", "/") for p in include])
+
         if os.path.isfile(root):
             yield root
             return
-        
-        for dirpath, dirnames, filenames in os.walk(root):
-            # 目录过滤
-            dirnames[:] = [
-                d for d in dirnames
-                if not any(fnmatch.fnmatch(os.path.join(dirpath, d).replace("\\", "/"), pat) for pat in norm_exclude)
-            ]
-            for name in filenames:
-                full = os.path.join(dirpath, name)
-                norm_full = full.replace("\\", "/")
-                if any(fnmatch.fnmatch(norm_full, pat) for pat in norm_exclude):
-                    continue
-                if norm_include and not any(fnmatch.fnmatch(norm_full, pat) for pat in norm_include):
-                    continue
-                yield full
+
+        # 直接基于os.scandir做栈式DFS：DirEntry的name/path/is_dir都
+        # 来自同一次getdents，免去os.walk之外的join和重复stat
+        stack = [root]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in exclude_names:
+                            continue
+                        if exc_re is not None and exc_re.match(entry.path.replace("\\", "/")):
+                            continue
+                        stack.append(entry.path)
+                    elif entry.is_dir():
+                        # 目录符号链接：与os.walk默认行为一致，不跟随也不产出
+                        continue
+                    else:
+                        norm_full = entry.path.replace("\\", "/")
+                        if exc_re is not None and exc_re.match(norm_full):
+                            continue
+                        if inc_re is not None and not inc_re.match(norm_full):
+                            continue
+                        yield entry.path
     
+    def _get_classifier(self, ext: str):
+        """获取按扩展名特化的行分类闭包（结果缓存）。
+
+        把注释符查表从每行一次提前到每个扩展名一次：闭包捕获该
+        扩展名的注释符元组，热循环里只剩局部变量和字符串方法调用。
+        返回的闭包以整数标签（_CODE/_COMMENT/_BLANK）表示分类结果。
+        备忘用实例字典而非functools.lru_cache：避免缓存键里持有
+        self导致实例无法回收，也便于__getstate__在pickle时剥离。
+        """
+        classifier = self._classifier_cache.get(ext)
+        if classifier is not None:
+            return classifier
+
+        pairs = tuple(self.multi_line_comments.get(ext, ()))
+        singles = tuple(self.single_line_comments.get(ext, ()))
+        # 单行注释符编译成一个交替正则：多注释符语言（如//和#并存）
+        # 每行只做一次C层match，而非逐符startswith
+        single_match = (
+            re.compile("|".join(re.escape(tok) for tok in singles)).match
+            if singles else None
+        )
+
+        def classify(line: str, in_block: Optional[Tuple[str, str]]) -> Tuple[int, Optional[Tuple[str, str]]]:
+            s = line.rstrip("\n\r")
+            stripped = s.lstrip()
+
+            if len(stripped) == 0:
+                return _BLANK, in_block
+
+            if in_block is not None:
+                if in_block[1] in s:
+                    return _COMMENT, None
+                return _COMMENT, in_block
+
+            for start, end in pairs:
+                start_pos = s.find(start)
+                if start_pos != -1:
+                    end_pos = s.find(end, start_pos + len(start))
+                    if end_pos != -1:
+                        before = s[:start_pos].strip()
+                        after = s[end_pos + len(end):].strip()
+                        if before or after:
+                            return _CODE, None
+                        return _COMMENT, None
+                    return _COMMENT, (start, end)
+
+            if single_match is not None and single_match(stripped):
+                return _COMMENT, None
+
+            return _CODE, None
+
+        self._classifier_cache[ext] = classify
+        return classify
+
     def classify_line(self, line: str, ext: str, in_block: Optional[Tuple[str, str]]) -> Tuple[str, Optional[Tuple[str, str]]]:
-        """分类代码行"""
-        s = line.rstrip("\n\r")
-        stripped = s.lstrip()
-        
-        if len(stripped) == 0:
-            return "blank", in_block
-        
-        pairs = self.multi_line_comments.get(ext, [])
-        if in_block is not None:
-            start, end = in_block
-            if end in s:
-                return "comment", None
-            else:
-                return "comment", in_block
-        
-        for start, end in pairs:
-            start_pos = s.find(start)
-            if start_pos != -1:
-                end_pos = s.find(end, start_pos + len(start))
-                if end_pos != -1:
-                    before = s[:start_pos].strip()
-                    after = s[end_pos + len(end):].strip()
-                    if before or after:
-                        return "code", None
-                    else:
-                        return "comment", None
-                else:
-                    return "comment", (start, end)
-        
-        for tok in self.single_line_comments.get(ext, []):
-            if stripped.startswith(tok):
-                return "comment", None
-        
-        return "code", None
+        """分类代码行（兼容接口，委托给按扩展名特化的分类器）"""
+        tag, in_block = self._get_classifier(ext)(line, in_block)
+        return _KIND_NAMES[tag], in_block
+
+    def _get_comment_line_re(self, ext: str) -> Optional["re.Pattern"]:
+        """获取匹配整行注释的多行模式正则（结果缓存，无注释符返回None）。"""
+        if ext in self._comment_re_cache:
+            return self._comment_re_cache[ext]
+        singles = self.single_line_comments.get(ext)
+        pattern = None
+        if singles:
+            pattern = re.compile(
+                r"(?m)^[^\S\n]*(?:" + "|".join(re.escape(tok) for tok in singles) + ")"
+            )
+        self._comment_re_cache[ext] = pattern
+        return pattern
+
+    def _get_comment_line_re_b(self, ext: str) -> Optional["re.Pattern"]:
+        """字节版的整行注释正则（注释符都是ASCII，可直接按字节匹配）。"""
+        if ext in self._comment_re_b_cache:
+            return self._comment_re_b_cache[ext]
+        singles = self.single_line_comments.get(ext)
+        pattern = None
+        if singles:
+            pattern = re.compile(
+                rb"(?m)^[^\S\n]*(?:"
+                + b"|".join(re.escape(tok.encode("ascii")) for tok in singles)
+                + rb")"
+            )
+        self._comment_re_b_cache[ext] = pattern
+        return pattern
+
+    def _count_text_whole(self, stat: FileStat, ext: str, text: str) -> FileStat:
+        """整文件正则统计（仅限无多行注释对的语言）。
+
+        空行/注释行各用一次多行正则findall在C层数出来，其余即代码行，
+        完全绕开逐行的Python分类循环。
+        """
+        if not text:
+            return stat
+        stat.total = text.count("\n") + (0 if text.endswith("\n") else 1)
+        blank = len(_BLANK_LINE_RE.findall(text))
+        if text.endswith("\n"):
+            blank -= 1  # 末尾换行符之后的位置会产生一个幻影空行匹配
+        comment_re = self._get_comment_line_re(ext)
+        comment = len(comment_re.findall(text)) if comment_re is not None else 0
+        stat.blank = blank
+        stat.comment = comment
+        stat.code = stat.total - blank - comment
+        return stat
+
+    def _count_bytes_whole(self, stat: FileStat, ext: str, data: bytes) -> FileStat:
+        """整文件字节级统计（无多行注释对且编码ASCII兼容时适用）。
+
+        total用bytes.count数换行符，空行/注释行用字节版正则findall，
+        全程不解码——大文件上这三步都是近memcpy速度的C层操作。
+        """
+        if data.startswith(codecs.BOM_UTF8):
+            data = data[3:]  # 文本路径解码utf-8-sig时也会剥掉BOM
+        if not data:
+            return stat
+        stat.total = data.count(b"\n") + (0 if data.endswith(b"\n") else 1)
+        blank = len(_BLANK_LINE_RE_B.findall(data))
+        if data.endswith(b"\n"):
+            blank -= 1  # 末尾换行符之后的位置会产生一个幻影空行匹配
+        comment_re = self._get_comment_line_re_b(ext)
+        comment = len(comment_re.findall(data)) if comment_re is not None else 0
+        stat.blank = blank
+        stat.comment = comment
+        stat.code = stat.total - blank - comment
+        return stat
     
+    @staticmethod
+    def _ext_of(path: str) -> str:
+        """取小写扩展名。
+
+        语义与os.path.splitext(path)[1].lower()一致（含".gitignore"
+        这类点开头文件无扩展名的规则），但省去splitext的元组和
+        中间字符串分配——每个文件都要走这一步。
+        """
+        dot = path.rfind(".")
+        if dot < 0:
+            return ""
+        base = path.rfind("/")
+        if os.sep != "/":
+            base = max(base, path.rfind(os.sep))
+        i = base + 1
+        while i < dot:
+            if path[i] != ".":
+                return path[dot:].lower()
+            i += 1
+        return ""
+
     def count_file(self, path: str) -> Optional[FileStat]:
         """统计单个文件"""
         try:
             # 确保路径是字符串类型
             if not isinstance(path, str):
                 return None
-            
-            ext = os.path.splitext(path)[1].lower()
-            # 对于常见文本/源码扩展名跳过二进制检测，以免误判
-            if ext not in self.text_like_exts and self.is_binary(path):
+
+            ext = self._ext_of(path)
+            trusted = ext in self.text_like_exts
+
+            # 无多行注释对的语言（Python/Shell/YAML等）：一次read
+            # 读入全文，二进制判定与编码探测都在已读缓冲的开头
+            # 4KB上完成，不再seek回绕也不构造文本流；ASCII兼容
+            # 编码直接在原始字节上统计，连解码都省掉
+            if ext not in self.multi_line_comments:
+                with open(path, "rb") as fb:
+                    data = fb.read()
+                sample = data[:4096]
+                if self._sample_rejects(sample, trusted):
+                    return None
+                stat = FileStat(path=path, ext=ext)
+                if self._encoding_from_sample(sample) != "utf-16":
+                    return self._count_bytes_whole(stat, ext, data)
+                return self._count_text_whole(
+                    stat, ext, data.decode("utf-16", errors="replace")
+                )
+
+            # 含多行注释对的语言仍走逐行分类，单次open完成
+            # 二进制判定+编码检测+文本包装（见_open_text_or_none）
+            wrapper = self._open_text_or_none(path, skip_binary_check=trusted)
+            if wrapper is None:
                 return None
-            stat = FileStat(path=path)
+            stat = FileStat(path=path, ext=ext)
             in_block: Optional[Tuple[str, str]] = None
-            encoding = self.detect_encoding(path)
-            with open(path, "r", encoding=encoding, errors="replace") as f:
+            with wrapper as f:
+                # 热循环只动局部整数计数器：分类器返回整数标签，
+                # 不经过任何方法调用或字典分发，结束后一次性回写
+                classify = self._get_classifier(ext)
+                code = comment = blank = 0
                 for line in f:
-                    kind, in_block = self.classify_line(line, ext, in_block)
-                    stat.add_line(kind)
+                    tag, in_block = classify(line, in_block)
+                    if tag == _CODE:
+                        code += 1
+                    elif tag == _COMMENT:
+                        comment += 1
+                    else:
+                        blank += 1
+                stat.code = code
+                stat.comment = comment
+                stat.blank = blank
+                stat.total = code + comment + blank
             return stat
         except (OSError, IOError, PermissionError, UnicodeDecodeError):
             return None
@@ -5,6 +5,7 @@
 代码统计业务逻辑服务
 """
 
+
 from typing import Dict, List, Optional, Set
 
 from services.code_statistics.base import CodeCounterBase
@@ -71,22 +72,32 @@ class CodeStatisticsService:
         summary = result["summary"]
         by_language = result["by_language"]
         elapsed_time = result["elapsed_time"]
-        
+
         # 如果指定了语言，过滤结果
         if selected_languages:
             by_language = {lang: stat for lang, stat in by_language.items() if lang in selected_languages}
-        
+
+        # 复用首次遍历发现的文件列表，避免函数统计再次遍历目录。
+        # 仅在未指定语言过滤（首次遍历覆盖全部文件）时可复用
+        py_files = None
+        c_files = None
+        if not include_patterns:
+            # FileStat.ext在统计阶段已填入，这里直接按字段过滤
+            py_files = [st.path for st in result["per_file"] if st.ext == ".py"]
+            c_exts = {".c", ".cpp", ".cc", ".cxx", ".h", ".hpp"}
+            c_files = [st.path for st in result["per_file"] if st.ext in c_exts]
+
         # 函数统计
         function_stats = None
         if include_function_stats:
-            function_stats = self.code_counter.count_python_functions(target_dir)
-        
+            function_stats = self.code_counter.count_python_functions(target_dir, files=py_files)
+
         c_function_stats = None
         has_c_like_language = any(
             lang.lower() in {"c", "c++", "c/c++ header", "c++ header"} for lang in by_language.keys()
         )
         if include_c_function_stats or has_c_like_language:
-            c_function_stats = self.code_counter.count_c_functions(target_dir)
+            c_function_stats = self.code_counter.count_c_functions(target_dir, files=c_files)
         
         return {
             "summary": summary,
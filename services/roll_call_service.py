@@ -11,7 +11,9 @@ from __future__ import annotations
 import csv
 import json
 import os
+import random
 import time
+import traceback
 from typing import Any, Dict, List, Optional, Tuple
 
 try:
@@ -130,7 +132,6 @@ class RollCallService:
         elif strategy == "least_called":
             students.sort(key=lambda s: s.called_count)
         else:
-            import random
             random.shuffle(students)
         
         if count and count > 0:
@@ -699,7 +700,6 @@ class RollCallService:
             
         except Exception as e:
             result['errors'].append(f"导入过程出错: {str(e)}")
-            import traceback
             result['errors'].append(traceback.format_exc())
         
         return result
@@ -14,19 +14,19 @@ def install_requirements():
     """安装依赖包"""
     print("正在安装依赖包...")
     
-    # 先尝试安装pygame的预编译版本
+    # 优先安装pygame-ce（社区维护版，blit/事件/字体渲染更快）
     try:
-        print("正在安装pygame...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pygame", "--upgrade"])
-        print("✓ pygame安装完成")
+        print("正在安装pygame-ce...")
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "pygame-ce", "--upgrade"])
+        print("✓ pygame-ce安装完成")
     except subprocess.CalledProcessError as e:
-        print(f"✗ pygame安装失败: {e}")
-        print("尝试安装pygame的预编译版本...")
+        print(f"✗ pygame-ce安装失败: {e}")
+        print("尝试安装pygame-ce的预编译版本...")
         try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "pygame", "--only-binary=all"])
-            print("✓ pygame预编译版本安装完成")
+            subprocess.check_call([sys.executable, "-m", "pip", "install", "pygame-ce", "--only-binary=all"])
+            print("✓ pygame-ce预编译版本安装完成")
         except subprocess.CalledProcessError:
-            print("✗ pygame安装失败，请手动安装")
+            print("✗ pygame-ce安装失败，请手动安装")
             return False
     
     # 安装其他依赖包
@@ -108,8 +108,8 @@ def main():
     print("=== 唐老鸭小游戏安装程序 ===")
     
     # 检查Python版本
-    if sys.version_info < (3, 7):
-        print("✗ 需要Python 3.7或更高版本")
+    if sys.version_info < (3, 10):
+        print("✗ 需要Python 3.10或更高版本")
         return
     
     print(f"✓ Python版本: {sys.version}")
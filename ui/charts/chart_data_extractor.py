@@ -9,6 +9,8 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 
 class ChartDataExtractor:
     """从代码统计结果中提取图表数据"""
@@ -63,59 +65,106 @@ class ChartDataExtractor:
             return int(stat)
         return None
     
+    @staticmethod
+    def _summarize(lengths_arr: np.ndarray) -> Dict[str, Any]:
+        """基于单个NumPy数组计算统计摘要（一次缓冲，四个归约）。"""
+        if lengths_arr.size == 0:
+            return {"均值": 0, "中位数": 0, "最小值": 0, "最大值": 0}
+        return {
+            "均值": float(lengths_arr.mean()),
+            "中位数": float(np.median(lengths_arr)),
+            "最小值": int(lengths_arr.min()),
+            "最大值": int(lengths_arr.max()),
+        }
+
     @staticmethod
     def extract_function_stats(function_stats: Optional[Any]) -> Dict[str, Any]:
         """
         从函数统计对象中提取数据
-        
+
         Returns:
             {
-                'lengths': [...],
+                'lengths': np.ndarray,
                 'summary': {'均值': ..., '中位数': ..., '最小值': ..., '最大值': ...}
             }
         """
-        lengths = []
-        summary_vals = {
-            "均值": 0,
-            "中位数": 0,
-            "最小值": 0,
-            "最大值": 0,
-        }
-        
+        lengths: List[int] = []
+        summary_vals = None
+
         if not function_stats:
-            return {"lengths": lengths, "summary": summary_vals}
-        
+            return {
+                "lengths": np.asarray(lengths, dtype=np.int32),
+                "summary": ChartDataExtractor._summarize(np.asarray(lengths, dtype=np.int32)),
+            }
+
         try:
             # 提取函数长度列表
             if hasattr(function_stats, "functions"):
-                funcs = getattr(function_stats, "functions")
-                for item in funcs:
-                    length = ChartDataExtractor._extract_function_length(item)
-                    if length is not None:
-                        lengths.append(length)
+                lengths = ChartDataExtractor._collect_lengths(getattr(function_stats, "functions"))
             elif isinstance(function_stats, dict) and "functions" in function_stats:
-                for item in function_stats["functions"]:
-                    length = ChartDataExtractor._extract_function_length(item)
-                    if length is not None:
-                        lengths.append(length)
-            
-            # 提取统计摘要
+                lengths = ChartDataExtractor._collect_lengths(function_stats["functions"])
+
+            # 提取统计摘要（优先复用对象上已计算的值，避免重复遍历）
             if hasattr(function_stats, "mean_length"):
-                summary_vals["均值"] = getattr(function_stats, "mean_length", 0) or 0
-                summary_vals["中位数"] = getattr(function_stats, "median_length", 0) or 0
-                summary_vals["最小值"] = getattr(function_stats, "min_length", 0) or 0
-                summary_vals["最大值"] = getattr(function_stats, "max_length", 0) or 0
+                summary_vals = {
+                    "均值": getattr(function_stats, "mean_length", 0) or 0,
+                    "中位数": getattr(function_stats, "median_length", 0) or 0,
+                    "最小值": getattr(function_stats, "min_length", 0) or 0,
+                    "最大值": getattr(function_stats, "max_length", 0) or 0,
+                }
             elif isinstance(function_stats, dict) and "summary" in function_stats:
                 info = function_stats["summary"]
-                summary_vals["均值"] = info.get("mean", 0) or 0
-                summary_vals["中位数"] = info.get("median", 0) or 0
-                summary_vals["最小值"] = info.get("min", 0) or 0
-                summary_vals["最大值"] = info.get("max", 0) or 0
+                summary_vals = {
+                    "均值": info.get("mean", 0) or 0,
+                    "中位数": info.get("median", 0) or 0,
+                    "最小值": info.get("min", 0) or 0,
+                    "最大值": info.get("max", 0) or 0,
+                }
         except Exception:
             pass
-        
-        return {"lengths": lengths, "summary": summary_vals}
+
+        # 直方图路径同样复用这份数组
+        lengths_arr = np.asarray(lengths, dtype=np.int32)
+        if summary_vals is None:
+            summary_vals = ChartDataExtractor._summarize(lengths_arr)
+
+        return {"lengths": lengths_arr, "summary": summary_vals}
     
+    @staticmethod
+    def _collect_lengths(funcs: Any) -> List[int]:
+        """
+        批量提取函数长度。
+
+        函数列表元素同构（同一来源产生），按首元素确定形状后用单个
+        推导式直接取属性，避免逐元素的hasattr/isinstance探测。
+        """
+        if not isinstance(funcs, (list, tuple)):
+            funcs = list(funcs)
+        if not funcs:
+            return []
+
+        first = funcs[0]
+        try:
+            if hasattr(first, "line_count"):
+                return [int(f.line_count) for f in funcs]
+            if hasattr(first, "length"):
+                return [int(f.length) for f in funcs]
+            if isinstance(first, dict):
+                if "line_count" in first:
+                    return [int(f["line_count"]) for f in funcs if "line_count" in f]
+                if "length" in first:
+                    return [int(f["length"]) for f in funcs if "length" in f]
+        except Exception:
+            pass
+
+        # 非同构兜底：退回逐元素探测
+        lengths: List[int] = []
+        for item in funcs:
+            length = ChartDataExtractor._extract_function_length(item)
+            if length is not None:
+                lengths.append(length)
+        return lengths
+
     @staticmethod
     def _extract_function_length(item: Any) -> Optional[int]:
         """从函数对象中提取长度"""
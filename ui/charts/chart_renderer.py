@@ -8,6 +8,9 @@
 
 from __future__ import annotations
 
+import traceback
+
+import tkinter as tk
 from typing import Any, Dict, List, Optional
 
 from ui.message_dialog import MessageDialogHelper
@@ -22,6 +25,10 @@ from ui.charts.chart_types import (
 from ui.charts.chart_layout import LayoutStrategy, DefaultLayoutStrategy
 from ui.charts.chart_data_extractor import ChartDataExtractor
 
+# rcParams是进程级全局状态，字体配置整个进程只需执行一次，
+# 与ChartRenderer实例个数无关
+_FONTS_CONFIGURED = False
+
 
 class ChartRenderer:
     """
@@ -39,8 +46,16 @@ class ChartRenderer:
         message_dialog: Optional[MessageDialogHelper] = None,
         style: Optional[ChartStyle] = None,
         layout_strategy: Optional[LayoutStrategy] = None,
+        tk_root: Optional[tk.Misc] = None,
     ):
-        self._fonts_configured = False
+        # 缓存的图表窗口与画布：刷新时在同一Figure/Canvas上重绘，
+        # 不经过pyplot（避免交互后端与Gcf全局注册表的开销和泄漏）
+        self._fig = None
+        self._canvas = None
+        self._axes: Optional[Dict[str, Any]] = None
+        self._layout_key = None
+        self._window: Optional[tk.Toplevel] = None
+        self._tk_root = tk_root
         self._message_dialog = message_dialog or MessageDialogHelper()
         self.style = style or ChartStyle()
         self.layout_strategy = layout_strategy or DefaultLayoutStrategy(
@@ -57,10 +72,13 @@ class ChartRenderer:
         }
 
     def _ensure_matplotlib_backend(self):
+        global _FONTS_CONFIGURED
         import matplotlib
 
-        matplotlib.use("TkAgg")
-        if not self._fonts_configured:
+        # Figure直接嵌入Tk窗口（FigureCanvasTkAgg），不走pyplot的交互
+        # 后端路径；Agg只作为兜底的无窗口后端
+        matplotlib.use("Agg")
+        if not _FONTS_CONFIGURED:
             try:
                 matplotlib.rcParams["font.sans-serif"] = [
                     "SimHei",
@@ -71,7 +89,7 @@ class ChartRenderer:
                 matplotlib.rcParams["axes.unicode_minus"] = False
             except Exception:
                 pass
-            self._fonts_configured = True
+            _FONTS_CONFIGURED = True
 
     def register_chart_type(self, chart_id: str, chart_type: ChartType) -> None:
         """
@@ -98,11 +116,32 @@ class ChartRenderer:
             self._message_dialog.show_warning("需要安装matplotlib才能显示图表:\npip install matplotlib", "警告")
         except Exception as exc:  # pragma: no cover - 仅用于调试
             print(f"显示图表错误: {exc}")
-            import traceback
 
             traceback.print_exc()
 
     # --- 内部实现 ---------------------------------------------------------
+    def _window_alive(self) -> bool:
+        """缓存的图表窗口是否仍然存在。"""
+        if self._window is None or self._fig is None or self._canvas is None:
+            return False
+        try:
+            return bool(self._window.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def _close_window(self):
+        """销毁图表窗口并清空缓存引用。"""
+        if self._window is not None:
+            try:
+                self._window.destroy()
+            except tk.TclError:
+                pass
+        self._window = None
+        self._canvas = None
+        self._fig = None
+        self._axes = None
+        self._layout_key = None
+
     def _create_integrated_chart(
         self,
         code_result: Dict[str, Any],
@@ -113,34 +152,55 @@ class ChartRenderer:
     ):
         """
         创建综合图表
-        
+
         重构后的实现：
         1. 使用布局策略创建布局
         2. 使用图表类型注册表绘制图表
         3. 使用数据提取器提取数据
         4. 易于扩展：添加新图表类型只需注册，无需修改此方法
         """
-        import matplotlib.pyplot as plt
+        from matplotlib.figure import Figure
 
         show_table = bool(detail_table and detail_table.get("rows"))
         using_external_fig = figure is not None
-        
-        # 创建或使用外部figure
-        if using_external_fig:
-            fig = figure
-        else:
-            fig_size = self.layout_strategy.get_figure_size(show_table)
-            fig = plt.figure(figsize=fig_size)
-            fig.canvas.manager.set_window_title("代码统计图表")
-        
+
         # 确定要绘制的图表类型列表
         chart_types_list = ['bar', 'pie', 'function_python', 'function_c']
         if show_table:
             chart_types_list.append('table')
-        
-        # 使用布局策略创建布局
-        axes = self.layout_strategy.create_layout(fig, chart_types_list, show_table)
-        
+        layout_key = (tuple(chart_types_list), show_table)
+
+        # 创建、复用缓存或使用外部figure
+        first_show = False
+        axes = None
+        if using_external_fig:
+            fig = figure
+        elif self._window_alive():
+            fig = self._fig
+            if self._layout_key == layout_key and self._axes:
+                # 窗口还开着且布局未变：逐个清空Axes后原位重绘，
+                # 省去artist整体拆除与子图重建
+                axes = self._axes
+                for ax in axes.values():
+                    ax.clear()
+            else:
+                # 布局变化（如新增明细表）：清空整个figure重建布局
+                fig.clf()
+        else:
+            # 旧窗口已被关闭：清理残留引用后重建
+            self._close_window()
+            fig_size = self.layout_strategy.get_figure_size(show_table)
+            fig = Figure(figsize=fig_size)
+            self._fig = fig
+            first_show = True
+
+        # 使用布局策略创建布局（仅在无法复用缓存Axes时）
+        if axes is None:
+            axes = self.layout_strategy.create_layout(fig, chart_types_list, show_table)
+        if not using_external_fig:
+            self._axes = axes
+            self._layout_key = layout_key
+
         # 提取数据
         language_data = ChartDataExtractor.extract_language_data(code_result)
         python_function_data = ChartDataExtractor.extract_function_stats(function_stats)
@@ -164,21 +224,35 @@ class ChartRenderer:
             table_chart = DetailTableChart(style=self.style)
             table_chart.plot(axes['table'], detail_table)
         
-        # 调整布局
+        # 调整布局：subplots_adjust使用固定比例，窗口缩放时自动随动，
+        # 无需在resize事件里重新求解布局
         def adjust_layout():
             self.layout_strategy.adjust_layout(fig, show_table)
 
         adjust_layout()
 
-        # 设置窗口大小调整事件处理
         if not using_external_fig:
-            def _refresh_layout(event=None):
-                adjust_layout()
-                fig.canvas.draw_idle()
-
-            fig.canvas.mpl_connect("resize_event", _refresh_layout)
-            plt.show(block=False)
+            if first_show:
+                self._show_in_window(fig)
+            else:
+                # 复用已有窗口：只请求一次惰性重绘
+                self._canvas.draw_idle()
         else:
             return adjust_layout
 
+    def _show_in_window(self, fig):
+        """把Figure嵌入Tk Toplevel窗口显示（替代pyplot.show）。"""
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        window = tk.Toplevel(self._tk_root) if self._tk_root is not None else tk.Toplevel()
+        window.title("代码统计图表")
+        window.protocol("WM_DELETE_WINDOW", self._close_window)
+
+        canvas = FigureCanvasTkAgg(fig, master=window)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        self._window = window
+        self._canvas = canvas
+
 
@@ -8,7 +8,7 @@ Tk 对话框管理器：负责唐老鸭聊天窗口的创建、输入处理与
 from __future__ import annotations
 
 import traceback
-from queue import Queue
+from collections import deque
 from typing import Callable, Optional
 
 import tkinter as tk
@@ -20,7 +20,7 @@ class ChatDialogManager:
     def __init__(
         self,
         tk_root: Optional[tk.Misc],
-        ui_queue: Optional[Queue],
+        ui_queue: Optional[deque],
         on_command: Optional[Callable[[str], None]] = None,
         *,
         focus_delay_frames: int = 10,
@@ -39,6 +39,7 @@ class ChatDialogManager:
         self._need_dialog = False
         self._need_set_focus = False
         self._focus_counter = 0
+        self._liveness_counter = 0
 
     # ------------------------------------------------------------------ 外部交互 --
     def request_dialog(self) -> None:
@@ -65,8 +66,10 @@ class ChatDialogManager:
             if self._focus_counter >= self._focus_delay_frames:
                 self._set_input_focus()
 
-        # 未捕获的销毁情况兜底重置
-        if self.dialog_active:
+        # 未捕获的销毁情况兜底重置：winfo_exists是一次Tcl往返，
+        # 销毁本身是罕见事件，每30帧慢速探测一次即可
+        self._liveness_counter += 1
+        if self.dialog_active and self._liveness_counter % 30 == 0:
             if not self.dialog_window or not self.dialog_window.winfo_exists():
                 self.dialog_active = False
                 self.dialog_window = None
@@ -75,14 +78,16 @@ class ChatDialogManager:
                 self._need_set_focus = False
 
     def is_active(self) -> bool:
-        return bool(self.dialog_active and self.dialog_window and self.dialog_window.winfo_exists())
+        # dialog_active 由 update() 里的慢速存活探测维护，
+        # 这里直接读标志即可，避免每帧一次 winfo_exists 的 Tcl 往返
+        return bool(self.dialog_active and self.dialog_window)
 
     def post_text(self, text: str) -> None:
         """线程安全地向对话框追加文本（通过 UI 队列）。"""
         if not text or not self._ui_queue:
             return
         try:
-            self._ui_queue.put(("append_text", text), block=False)
+            self._ui_queue.append(("append_text", text))
         except Exception as exc:  # pragma: no cover - 仅记录
             print(f"提交文本到 UI 队列失败: {exc}")
 
@@ -97,7 +102,6 @@ class ChatDialogManager:
             self.text_display.insert(tk.END, text)
             self.text_display.see(tk.END)
             self.text_display.config(state=tk.DISABLED)
-            self.dialog_window.update_idletasks()
         except tk.TclError as exc:
             # 组件已销毁或主循环不存在，忽略
             print(f"[ChatDialog] 插入文本失败: {exc}")
@@ -130,9 +134,8 @@ class ChatDialogManager:
             dialog_window.title("与唐老鸭对话")
             dialog_window.geometry("600x500")
             dialog_window.minsize(400, 300)
-            dialog_window.focus_set()
-            dialog_window.deiconify()
-            dialog_window.update_idletasks()
+            # Toplevel创建后默认可见；焦点由延迟的_set_input_focus统一设置，
+            # 这里不再做deiconify/update_idletasks的额外Tcl往返
 
             # 快捷按钮区域（放在最上面）
             quick_button_frame = tk.Frame(dialog_window)
@@ -253,10 +256,8 @@ class ChatDialogManager:
             if not (self.dialog_window and self.dialog_window.winfo_exists() and self.input_entry):
                 self._need_set_focus = False
                 return
-            self.dialog_window.focus_set()
             self.input_entry.config(state=tk.NORMAL)
             self.input_entry.focus_set()
-            self.dialog_window.update_idletasks()
         except Exception as exc:
             print(f"[ChatDialog] 设置输入焦点失败: {exc}")
         finally:
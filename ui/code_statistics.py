@@ -12,6 +12,7 @@ import json
 import os
 import threading
 import time
+import traceback
 from datetime import datetime
 from typing import Any, Dict, Optional, Set
 
@@ -48,7 +49,9 @@ class CodeStatisticsUI:
         self._stop_behavior = stop_behavior_callback
         self._default_target_dir = default_target_dir or os.getcwd()
         self._message_dialog = MessageDialogHelper(tk_root=tk_root)
-        self._chart_renderer = chart_renderer or ChartRenderer(message_dialog=self._message_dialog)
+        self._chart_renderer = chart_renderer or ChartRenderer(
+            message_dialog=self._message_dialog, tk_root=tk_root
+        )
         
         # 初始化服务和导出器
         self._statistics_service = CodeStatisticsService(code_counter)
@@ -356,12 +359,10 @@ class CodeStatisticsUI:
             tk.Frame(button_frame).pack(side=tk.LEFT, fill=tk.X, expand=True)
 
             config_window.protocol("WM_DELETE_WINDOW", cleanup_config_dialog)
-            config_window.update_idletasks()
             config_window.focus_set()
             self._config_window = config_window
         except Exception as exc:
             print(f"创建代码统计配置对话框时出错: {exc}")
-            import traceback
 
             traceback.print_exc()
             self._message_dialog.show_error(f"创建配置对话框失败: {exc}", "错误")
@@ -390,7 +391,7 @@ class CodeStatisticsUI:
     ):
         """启动代码统计（后台线程）"""
         detail_languages = detail_languages or set()
-        self._ui_queue.put(("change_duckling_theme", "focused"))
+        self._ui_queue.append(("change_duckling_theme", "focused"))
         self._trigger_behavior("code_count")
 
         try:
@@ -450,16 +451,15 @@ class CodeStatisticsUI:
                 )
 
             self._enqueue_show_charts(result, function_stats, c_function_stats, detail_table)
-            self._ui_queue.put(("change_duckling_theme", "original"))
+            self._ui_queue.append(("change_duckling_theme", "original"))
 
             # 注意：代码统计行为会在持续时间（5秒）后自动停止，不需要手动停止
         except Exception as exc:
             print(f"代码统计错误: {exc}")
-            import traceback
 
             traceback.print_exc()
             self._update_text(f"唐老鸭: 抱歉，代码统计出现了问题: {str(exc)}\n\n")
-            self._ui_queue.put(("change_duckling_theme", "original"))
+            self._ui_queue.append(("change_duckling_theme", "original"))
 
     # ------------------------------------------------------------- HELPERS --
     def _build_detail_table_data(
@@ -587,7 +587,7 @@ class CodeStatisticsUI:
     # ---------------------------------------------------------- UI QUEUE OPS --
     def _enqueue_show_charts(self, code_result, function_stats=None, c_function_stats=None, detail_table=None):
         try:
-            self._ui_queue.put(("show_charts", code_result, function_stats, c_function_stats, detail_table), block=False)
+            self._ui_queue.append(("show_charts", code_result, function_stats, c_function_stats, detail_table))
         except Exception as exc:
             print(f"提交图表显示到队列失败: {exc}")
 
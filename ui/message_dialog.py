@@ -11,12 +11,23 @@ from typing import Optional
 
 try:
     import tkinter as tk
-    from tkinter import messagebox
     HAS_TKINTER = True
 except ImportError:
     HAS_TKINTER = False
     tk = None
-    messagebox = None
+
+# messagebox子模块延迟到第一次真正弹框时才导入：
+# 正常对局可能一个消息框都不弹，启动路径无需付这笔导入开销
+_messagebox = None
+
+
+def _get_messagebox():
+    """导入并缓存tkinter.messagebox子模块。"""
+    global _messagebox
+    if _messagebox is None:
+        from tkinter import messagebox
+        _messagebox = messagebox
+    return _messagebox
 
 
 class MessageDialogHelper:
@@ -69,7 +80,7 @@ class MessageDialogHelper:
             return
 
         try:
-            messagebox.showerror(title or self._default_title, message)
+            _get_messagebox().showerror(title or self._default_title, message)
         except Exception as e:
             print(f"[MessageDialog] 显示错误消息框失败: {e}")
             print(f"[错误] {title or self._default_title}: {message}")
@@ -87,7 +98,7 @@ class MessageDialogHelper:
             return
 
         try:
-            messagebox.showwarning(title or self._default_title, message)
+            _get_messagebox().showwarning(title or self._default_title, message)
         except Exception as e:
             print(f"[MessageDialog] 显示警告消息框失败: {e}")
             print(f"[警告] {title or self._default_title}: {message}")
@@ -105,7 +116,7 @@ class MessageDialogHelper:
             return
 
         try:
-            messagebox.showinfo(title or self._default_title, message)
+            _get_messagebox().showinfo(title or self._default_title, message)
         except Exception as e:
             print(f"[MessageDialog] 显示信息消息框失败: {e}")
             print(f"[信息] {title or self._default_title}: {message}")
@@ -126,7 +137,7 @@ class MessageDialogHelper:
             return False
 
         try:
-            return messagebox.askyesno(title or self._default_title, message)
+            return _get_messagebox().askyesno(title or self._default_title, message)
         except Exception as e:
             print(f"[MessageDialog] 显示确认对话框失败: {e}")
             print(f"[确认] {title or self._default_title}: {message}")
@@ -148,7 +159,7 @@ class MessageDialogHelper:
             return False
 
         try:
-            return messagebox.askokcancel(title or self._default_title, message)
+            return _get_messagebox().askokcancel(title or self._default_title, message)
         except Exception as e:
             print(f"[MessageDialog] 显示确认对话框失败: {e}")
             print(f"[确认] {title or self._default_title}: {message}")
@@ -8,7 +8,7 @@ UI队列处理器：统一处理UI队列消息，解耦消息类型与处理逻
 from __future__ import annotations
 
 import traceback
-from queue import Queue
+from collections import deque
 from typing import Any, Callable, Dict, Optional
 
 
@@ -43,25 +43,29 @@ class UIQueueProcessor:
         """
         self._handlers.pop(message_type, None)
 
-    def process_queue(self, queue: Queue, limit_per_frame: int = 20) -> int:
+    def process_queue(self, queue: deque, limit_per_frame: int = 20) -> int:
         """
         处理队列中的消息。
 
         Args:
-            queue: UI消息队列
+            queue: UI消息队列（deque，append/popleft在GIL下原子）
             limit_per_frame: 每帧最多处理的消息数量
 
         Returns:
             实际处理的消息数量
         """
-        if not queue:
+        if queue is None:
             return 0
 
         processed = 0
-        while not queue.empty() and processed < limit_per_frame:
+        text_buffer: list = []
+        # 空队列由popleft抛IndexError退出循环，省去每轮的真值检查；
+        # 方法绑定到局部变量，跳过逐次属性查找
+        popleft = queue.popleft
+        for _ in range(limit_per_frame):
             try:
-                item = queue.get_nowait()
-            except Exception:
+                item = popleft()
+            except IndexError:
                 break
 
             processed += 1
@@ -74,19 +78,41 @@ class UIQueueProcessor:
                 continue
 
             message_type = item[0]
-            handler = self._handlers.get(message_type)
 
-            if handler:
-                try:
-                    handler(item)
-                except Exception as e:
-                    print(f"[UIQueueProcessor] 处理消息 '{message_type}' 时出错: {e}")
-                    traceback.print_exc()
-            else:
-                print(f"[UIQueueProcessor] 未注册的消息类型: {message_type}, 已注册的类型: {list(self._handlers.keys())}")
+            # 合并连续的 append_text 消息，一次性插入，避免每条消息都触发Tk控件操作
+            if message_type == "append_text":
+                text_buffer.append(item[1] if len(item) > 1 else "")
+                continue
+
+            self._flush_text_buffer(text_buffer)
+            self._dispatch(message_type, item)
+
+        self._flush_text_buffer(text_buffer)
 
         return processed
 
+    def _dispatch(self, message_type: str, item) -> None:
+        """分发单条消息到已注册的处理器。"""
+        handler = self._handlers.get(message_type)
+
+        if handler:
+            try:
+                handler(item)
+            except Exception as e:
+                print(f"[UIQueueProcessor] 处理消息 '{message_type}' 时出错: {e}")
+                traceback.print_exc()
+        else:
+            print(f"[UIQueueProcessor] 未注册的消息类型: {message_type}, 已注册的类型: {list(self._handlers.keys())}")
+
+    def _flush_text_buffer(self, text_buffer: list) -> None:
+        """将累积的文本消息合并为一条 append_text 消息分发。"""
+        if not text_buffer:
+            return
+        merged = "".join(text_buffer)
+        text_buffer.clear()
+        if merged:
+            self._dispatch("append_text", ("append_text", merged))
+
     def has_handler(self, message_type: str) -> bool:
         """检查是否已注册指定类型的处理器。"""
         return message_type in self._handlers
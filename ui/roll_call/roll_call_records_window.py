@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 import os
+import traceback
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from typing import Any, Callable, Dict, List, Optional
@@ -284,7 +285,6 @@ class RollCallRecordsWindow:
                 )
         except Exception as e:
             print(f"[RollCallRecordsWindow] 刷新记录失败: {e}")
-            import traceback
             traceback.print_exc()
             self._message_dialog.show_error(f"刷新记录列表失败: {e}")
 
@@ -8,8 +8,9 @@ Roll call window: combined configuration + execution UI.
 from __future__ import annotations
 
 import os
+import traceback
 import tkinter as tk
-from tkinter import filedialog
+from tkinter import filedialog, messagebox
 from typing import Any, Callable, Dict, Optional
 
 from ui.message_dialog import MessageDialogHelper
@@ -91,15 +92,20 @@ class RollCallWindow:
         self._refresh_mode()
 
     def _build_config_frame(self, parent: tk.Frame) -> None:
+        # 配置控件引用在构建时收集一次，启停时直接遍历，
+        # 不再每次递归走winfo_children()查找控件树
+        self._config_widgets = []
+
         mode_frame = tk.Frame(parent)
         mode_frame.pack(fill=tk.X, pady=5)
         tk.Label(mode_frame, text="点名方式:", font=("Arial", 11, "bold")).pack(side=tk.LEFT)
-        tk.Radiobutton(mode_frame, text="全点", variable=self._mode_var, value="all", command=self._refresh_mode).pack(
-            side=tk.LEFT, padx=5
-        )
-        tk.Radiobutton(
+        rb_all = tk.Radiobutton(mode_frame, text="全点", variable=self._mode_var, value="all", command=self._refresh_mode)
+        rb_all.pack(side=tk.LEFT, padx=5)
+        rb_partial = tk.Radiobutton(
             mode_frame, text="抽点", variable=self._mode_var, value="partial", command=self._refresh_mode
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        rb_partial.pack(side=tk.LEFT, padx=5)
+        self._config_widgets.extend([rb_all, rb_partial])
 
         count_frame = tk.Frame(parent)
         count_frame.pack(fill=tk.X, pady=5)
@@ -116,6 +122,7 @@ class RollCallWindow:
             )
             rb.pack(side=tk.LEFT, padx=3)
             self._count_widgets.append(rb)
+            self._config_widgets.append(rb)
         self._custom_entry = tk.Spinbox(
             count_frame,
             from_=1,
@@ -125,19 +132,19 @@ class RollCallWindow:
             state=tk.DISABLED,
         )
         self._custom_entry.pack(side=tk.LEFT, padx=5)
+        self._config_widgets.append(self._custom_entry)
 
         strategy_frame = tk.Frame(parent)
         strategy_frame.pack(fill=tk.X, pady=5)
         tk.Label(strategy_frame, text="点名策略:", font=("Arial", 10)).pack(side=tk.LEFT)
-        tk.Radiobutton(
-            strategy_frame, text="随机选取", variable=self._strategy_var, value="random"
-        ).pack(side=tk.LEFT, padx=5)
-        tk.Radiobutton(
-            strategy_frame, text="优先旷课最多", variable=self._strategy_var, value="most_absent"
-        ).pack(side=tk.LEFT, padx=5)
-        tk.Radiobutton(
-            strategy_frame, text="优先点到最少", variable=self._strategy_var, value="least_called"
-        ).pack(side=tk.LEFT, padx=5)
+        for text, value in [
+            ("随机选取", "random"),
+            ("优先旷课最多", "most_absent"),
+            ("优先点到最少", "least_called"),
+        ]:
+            rb = tk.Radiobutton(strategy_frame, text=text, variable=self._strategy_var, value=value)
+            rb.pack(side=tk.LEFT, padx=5)
+            self._config_widgets.append(rb)
 
         btn_frame = tk.Frame(parent)
         btn_frame.pack(fill=tk.X, pady=(10, 0))
@@ -255,7 +262,6 @@ class RollCallWindow:
             return
         
         # 询问用户是否更新已存在的学生
-        import tkinter.messagebox as messagebox
         update_existing = messagebox.askyesno(
             "导入选项",
             "是否更新已存在的学生？\n\n"
@@ -305,7 +311,6 @@ class RollCallWindow:
                     self._message_dialog.show_error(f"导入失败:\n{error_msg}")
         except Exception as e:
             print(f"[RollCallWindow] 导入学生失败: {e}")
-            import traceback
             traceback.print_exc()
             if self._message_dialog:
                 self._message_dialog.show_error(f"导入失败: {str(e)}")
@@ -358,19 +363,17 @@ class RollCallWindow:
     def _set_config_controls(self, enabled: bool) -> None:
         state = tk.NORMAL if enabled else tk.DISABLED
 
-        def set_state(widget):
-            if isinstance(widget, (tk.Button, tk.Radiobutton, tk.Spinbox)):
-                widget.config(state=state)
-
-        if self._window:
-            for child in self._window.winfo_children():
-                if isinstance(child, tk.LabelFrame) and child.cget("text") == "点名配置":
-                    for widget in child.winfo_children():
-                        set_state(widget)
+        # 遍历构建时缓存的控件列表，避免每次在整棵控件树里查找
+        for widget in getattr(self, "_config_widgets", []):
+            widget.config(state=state)
 
         if self._start_button:
             self._start_button.config(state=state)
 
+        # 重新启用后由模式决定抽点控件的可用性
+        if enabled:
+            self._refresh_mode()
+
     def _set_execution_controls(self, enabled: bool) -> None:
         state = tk.NORMAL if enabled else tk.DISABLED
         for btn in [self._button_present, self._button_leave, self._button_absent, self._button_late]:
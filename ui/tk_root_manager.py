@@ -7,24 +7,26 @@ Tkinter根窗口管理器：统一管理Tk根窗口的创建、事件循环、
 
 from __future__ import annotations
 
+import time
 from typing import Optional
 
 import tkinter as tk
+import _tkinter
 
 
 class TkRootManager:
     """统一管理Tkinter根窗口的生命周期和事件循环。"""
 
-    def __init__(self, update_interval: int = 5):
+    def __init__(self, min_update_interval: float = 0.033):
         """
         初始化Tk根窗口管理器。
 
         Args:
-            update_interval: 每N帧调用一次update()，默认5帧（约83ms）
+            min_update_interval: 空闲时两次update()的最小间隔（秒），默认33ms（约30Hz）
         """
         self._root: Optional[tk.Tk] = None
-        self._update_counter: int = 0
-        self._update_interval: int = max(update_interval, 1)
+        self._min_update_interval: float = max(min_update_interval, 0.0)
+        self._last_update_ts: float = 0.0
         self._initialized: bool = False
 
     def initialize(self) -> bool:
@@ -71,27 +73,29 @@ class TkRootManager:
         """
         if not self.is_initialized():
             return
-        
-        # 即使 has_active_windows 为 False，也要更新，因为可能有新窗口刚创建
+
+        # 有活跃窗口时每帧更新保证输入响应；空闲时按壁钟节流，避免冗余的Tk往返
+        now = time.monotonic()
+        if not has_active_windows and (now - self._last_update_ts) < self._min_update_interval:
+            return
+
         try:
-            self._update_counter += 1
-            # 每帧都调用update_idletasks()，确保UI更新
-            self._root.update_idletasks()
-
-            # 每N帧调用一次update()，处理键盘和关闭事件
-            if self._update_counter % self._update_interval == 0:
-                try:
-                    self._root.update()
-                except (tk.TclError, RuntimeError, Exception):
-                    # 忽略所有错误，确保程序继续运行
-                    pass
+            # 用限量的dooneevent泵代替update()：update()会清空整个Tk事件队列，
+            # 事件风暴时可能长时间占住游戏主循环；这里每次最多处理100个事件，
+            # 既处理键盘/关闭/idle任务，又保证单帧耗时有上界
+            processed = 0
+            while self._root.tk.dooneevent(_tkinter.DONT_WAIT):
+                processed += 1
+                if processed >= 100:
+                    break
+            self._last_update_ts = now
         except Exception:
             # 忽略所有异常，确保游戏主循环不受影响
             pass
 
     def reset_update_counter(self) -> None:
-        """重置更新计数器（通常不需要手动调用）。"""
-        self._update_counter = 0
+        """重置更新节流计时（通常不需要手动调用）。"""
+        self._last_update_ts = 0.0
 
     def shutdown(self) -> None:
         """关闭根窗口（通常在程序退出时调用）。"""